@@ -1,9 +1,10 @@
 # flake8: noqa F401
 from .dysys import DySys
 from .signal_flow_path_sys import SignalFlowPathSys
+from .batched_path_sys import BatchedPathSys
 from .linear_dysys import (ScalarLinearDySys, SparseDySys,
                            NonlinearSparseDySys, SparseNFDySys)
-from .odysys import ODySys
+from .odysys import ODySys, IVPDySys
 from .algebraic_dysys import AlgebraicDySys
 from .uncoupled_dysys import UncoupledDySys
 from .newmark import Newmark, HilberHughesTaylor
@@ -0,0 +1,111 @@
+"""A batch of signal-flow paths of identical topology.
+
+In a parameter sweep, many SignalFlowPathSys with the same subsystems
+but different initial conditions or inputs are marched side by side.
+Here the states of all the paths in the batch are kept together, as
+arrays with one column per path, so that each linear subsystem is
+stepped once for the whole batch, its factors solving all the
+right-hand sides at once, rather than once per path.
+
+"""
+
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .dysys import DySys
+from .signal_flow_path_sys import SignalFlowPathSys
+
+
+class BatchedPathSys(SignalFlowPathSys):
+
+    def __init__(self,
+                 systems: Sequence[DySys],
+                 functions: Optional[Sequence[Callable[..., Any]]]=None,
+                 batch: int=1):
+        """construct a BatchedPathSys
+
+        :param systems: sequence of DySys, each with states that are
+        scalars or one-dimensional numpy.ndarray, the batch of which
+        is an array with an extra last axis running over the paths
+
+        :param functions: sequence of functions, one shorter than
+        systems, being the mappings of (time, state) between systems
+        along the list; these receive and must return arrays with one
+        column per path
+
+        :param batch: int, number of paths
+
+        The systems which take batches (having the class attribute
+        batches, e.g. SparseDySys and ScalarLinearDySys) are stepped
+        for the whole batch at once, so their forcing functions must
+        also return arrays with one column per path (or a single
+        column or scalar, broadcast); the other subsystems are stepped
+        path by path.
+
+        """
+
+        self.batch = batch
+        super(BatchedPathSys, self).__init__(systems, functions)
+
+    @property
+    def systems(self) -> Tuple[DySys, ...]:
+        return self._systems
+
+    @systems.setter
+    def systems(self, systems: Sequence[DySys]):
+        SignalFlowPathSys.systems.fset(self, systems)
+        self._zero = [np.repeat(np.asarray(z)[..., None], self.batch, -1)
+                      for z in self._zero]
+        self._steps = [s.step if s.batches else _pathwise_step(s.step)
+                       for s in self.systems]
+        self._equilibria = [
+            _broadcast_equilibrium(s.equilibrium, z.ndim, self.batch)
+            if s.batches else _pathwise_equilibrium(s.equilibrium)
+            for s, z in zip(self.systems, self._zero)]
+
+
+def _column(inputs: Optional[Any], j: int) -> Optional[Any]:
+    """return the inputs of the j-th path of a batch"""
+    return None if inputs is None else tuple(y[..., j] for y in inputs)
+
+
+def _pathwise_step(step: Callable[..., np.ndarray]
+                   ) -> Callable[..., np.ndarray]:
+    """return a step for a batch, stepping each path in turn"""
+
+    def batched(t, h, x, d, inputs=None):
+        return np.stack([step(t, h, x[..., j], d, _column(inputs, j))
+                         for j in range(x.shape[-1])], -1)
+
+    return batched
+
+
+def _broadcast_equilibrium(equilibrium: Callable[..., np.ndarray],
+                           ndim: int,
+                           batch: int) -> Callable[..., np.ndarray]:
+    """return an equilibrium for a batch, solved for all paths at once
+
+    and repeated over the batch if the forcing did not vary over it,
+    so having one axis fewer than the ndim of the batched states
+
+    """
+
+    def batched(*args, **kwargs):
+        x = np.asarray(equilibrium(*args, **kwargs))
+        return np.repeat(x[..., None], batch, -1) if x.ndim < ndim else x
+
+    return batched
+
+
+def _pathwise_equilibrium(equilibrium: Callable[..., np.ndarray]
+                          ) -> Callable[..., np.ndarray]:
+    """return an equilibrium for a batch, solving each path in turn"""
+
+    def batched(x, d=None, *inputs, **kwargs):
+        return np.stack([
+            equilibrium(x[..., j], d, *[_column(y, j) for y in inputs],
+                        **kwargs)
+            for j in range(x.shape[-1])], -1)
+
+    return batched
@@ -37,6 +37,8 @@ class DySys():
 
     """
 
+    batches = False             # whether step takes a batch of states
+
     def __init__(self):
         raise NotImplementedError
 
@@ -85,7 +87,8 @@ class DySys():
 
         """
 
-        return self.step(np.inf, np.inf, y0 or self.zero, d, **kwargs)
+        return self.step(np.inf, np.inf, self.zero if y0 is None else y0, d,
+                         **kwargs)
 
     def step(self,
              t: float,
@@ -232,6 +235,45 @@ class DySys():
                 else:
                     t, x = t + h, self._step(t, h, x, d, substeps)
 
+    def march_array(self,
+                    h: float,
+                    n_steps: int,
+                    x: Optional[Any]=None,
+                    d: Optional[Any]=None,
+                    **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """return the first n_steps of self.march as arrays
+
+        preallocated rather than accumulated in Python containers,
+        for states that are scalars or arrays of fixed shape
+
+        :param h: float > 0, time-step
+
+        :param n_steps: int, number of time-steps
+
+        :param x: optional initial condition (default: self.zero)
+
+        :param d: optional dict of discrete dynamical variables
+
+        Further keyword arguments (e.g. events) are passed on to
+        self.march.
+
+        :rtype: pair of times, with shape (n_steps + 1,), and states,
+        with shape (n_steps + 1,) + the shape of a state
+
+        """
+
+        t = np.empty(n_steps + 1)
+        X = None
+        for k, (tk, xk, _) in enumerate(
+                it.islice(self.march(h, x, d, **kwargs), n_steps + 1)):
+            if X is None:
+                xk = np.asarray(xk)
+                X = np.empty((n_steps + 1,) + xk.shape,
+                             np.result_type(xk, float))
+            t[k] = tk
+            X[k] = xk
+        return t, X
+
     def march_truncated(self, condition, *args, **kwargs):
         """truncate a march when condition fails
 
@@ -308,13 +350,29 @@ class DySys():
         # (i.e. raises TypeError: dia_matrix object has no
         # attribute __getitem__)
 
-        size = len(self)
-        I = self.identity       # noqa E741
+        # The selections of columns of the identity are built directly
+        # (in linear time, rather than by sorting and slicing) and
+        # kept for each sequence of knowns.
 
-        return ((I, np.zeros((size, 0))) if len(known) == 0
-                else
-                (I[:, np.setdiff1d(np.arange(size), np.mod(known, size))],
-                 I[:, known]))
+        size = len(self)
+        if len(known) == 0:
+            return self.identity, np.zeros((size, 0))
+
+        if not hasattr(self, '_node_maps'):
+            self._node_maps = {}
+        key = tuple(np.mod(known, size).tolist())
+        if key not in self._node_maps:
+            rows = np.array(key)
+            free = np.ones(size, dtype=bool)
+            free[rows] = False
+            self._node_maps[key] = (
+                csr_matrix((np.ones(np.count_nonzero(free)),
+                            np.arange(np.count_nonzero(free)),
+                            np.concatenate([[0], np.cumsum(free)])),
+                           (size, np.count_nonzero(free))),
+                csr_matrix((np.ones(rows.size), (rows, np.arange(rows.size))),
+                           (size, rows.size)))
+        return self._node_maps[key]
 
     @staticmethod
     def reconstituter(U, K, x, u):
@@ -374,7 +432,7 @@ class DySys():
                                [t, t + h], inputs)
         elif self.f is not None:
             [fold, fnew] = map(lambda t: self.f(self, t, x, d), [t, t + h])
-        elif self.master is not None:
+        elif getattr(self, 'master', None) is not None:
             yold = self.master.pop('state')
             try:
                 ynew = self.master['state'] = self.master['system'].step(
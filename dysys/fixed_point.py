@@ -1,8 +1,11 @@
 import itertools as it
+from functools import partial
+from typing import Callable
 
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 from scipy.sparse import issparse, spmatrix
-from scipy.sparse.linalg import spsolve
+from scipy.sparse.linalg import splu, spsolve
 
 
 def fixed_point(iteration, tol=np.finfo(float).eps, maxiter=np.iinfo(int).max):
@@ -28,33 +31,77 @@ def fixed_point(iteration, tol=np.finfo(float).eps, maxiter=np.iinfo(int).max):
                 if np.linalg.norm(h) < tol)
 
 
-def newton(residual, jacobian, x, *args, **kwargs):
+def newton(residual, jacobian, x, tol=np.finfo(float).eps,
+           maxiter=np.iinfo(int).max, linsolve=None, factor_reuse=False):
     '''eliminate the residual by Newton-iteration
 
     :param: residual, a function taking a one-dimensional
     numpy.ndarray to another array of the same len
 
     :param: jacobian, a function like residual but returning a square
-    numpy.array of corresponding shape
+    numpy.array of corresponding shape, or a one-dimensional array
+    being its diagonal if it is diagonal, in which case each
+    iteration is an elementwise division
 
     :param: x, a one-dimensional numpy.ndarray of the length expected
-    by the residual and jacobian functions
+    by the residual and jacobian functions; it is copied, the
+    iteration then updating the copy in place, so residual and
+    jacobian should not keep their argument
 
-    Any other positional or keyword arguments are passed on to
-    fixed_point; of particular interest are tol and maxiter.
+    :param: tol, positive float, the iteration stopping when the norm
+    of the correction falls below it
+
+    :param: maxiter, positive integer, after which RuntimeError is
+    raised
+
+    :param: linsolve, optional function like solve, for the linear
+    system of each iteration, defaulting to a new one from
+    reordering_solver, since the sparsity pattern of the jacobian
+    usually does not change from iteration to iteration
+
+    :param: factor_reuse, bool, for modified Newton-iteration,
+    factorizing the jacobian once and reusing the factors for
+    subsequent iterations, refactorizing at the current x only when
+    the correction fails to halve; linsolve is then ignored
 
     '''
 
     # TODO gmcbain 2016-10-28: Can we really not use
     # scipy.optimize.root?  DySys#39
 
-    def iteration(x):
-        while True:
-            dx = solve(jacobian(x), residual(x))
-            x = x - dx
-            yield x, dx
+    linsolve = reordering_solver() if linsolve is None else linsolve
+    x = np.array(x, np.result_type(x, float))
+    factors, last = None, np.inf
+    for _ in range(maxiter):
+        if factor_reuse:
+            if factors is None:
+                factors = factorize(jacobian(x))
+            dx = factors(residual(x))
+        else:
+            dx = linsolve(jacobian(x), residual(x))
+        x -= dx
+        size = np.linalg.norm(dx)
+        if size < tol:
+            return x
+        if size > last / 2:     # stalling, so refactorize
+            factors = None
+        last = size
+    raise RuntimeError('Newton-iteration did not converge')
+
+
+def factorize(A) -> Callable[[np.ndarray], np.ndarray]:
+    '''return a function solving A x = b for x, given b
+
+    by sparse-LU (SuperLU) if scipy.sparse.issparse(A), by division
+    if A is one-dimensional, being the diagonal, else dense LU
 
-    return fixed_point(iteration(x), *args, **kwargs)
+    '''
+
+    if issparse(A):
+        return splu(A.tocsc()).solve
+    if np.ndim(A) == 1:
+        return lambda b: b / A
+    return partial(lu_solve, lu_factor(A))
 
 
 def solve(A: spmatrix,
@@ -64,10 +111,14 @@ def solve(A: spmatrix,
 
     Further positional and keyword arguments are passed on to
     scipy.sparse.linalg.spsolve or numpy.linalg.solve depending on
-    whether scipy.sparse.issparse(A).
+    whether scipy.sparse.issparse(A).  A one-dimensional A is taken as
+    the diagonal of a diagonal matrix, by which b is divided.
 
     '''
 
+    if np.ndim(A) == 1:
+        return b / A
+
     if issparse(A):
         try:
             return spsolve(A, b, *args, **kwargs)
@@ -77,3 +128,33 @@ def solve(A: spmatrix,
             return b / A.toarray()[0, 0]
     else:
         return np.linalg.solve(A, b, *args, **kwargs)
+
+
+def reordering_solver() -> Callable[[spmatrix, np.ndarray], np.ndarray]:
+    '''return a function like solve for a sequence of linear systems
+
+    which reuses the fill-reducing column ordering of SuperLU from
+    one sparse matrix to the next as long as their sparsity pattern
+    is unchanged, as for the Jacobians of successive Newton iterations
+
+    '''
+
+    memo = {}
+
+    def linsolve(A, b):
+        if not issparse(A):
+            return solve(A, b)
+        A = A.tocsc()
+        if ('columns' in memo and
+                np.array_equal(memo['indptr'], A.indptr) and
+                np.array_equal(memo['indices'], A.indices)):
+            columns = memo['columns']
+            x = np.empty(len(b), np.result_type(A.dtype, b))
+            x[columns] = splu(A[:, columns], permc_spec='NATURAL').solve(b)
+            return x
+        lu = splu(A)
+        memo.update(indptr=A.indptr, indices=A.indices,
+                    columns=np.argsort(lu.perm_c))
+        return lu.solve(b)
+
+    return linsolve
@@ -6,6 +6,8 @@ generalization of the Newmark method
 
 """
 
+from scipy.sparse.linalg import splu
+
 from .dysys import DySys
 from .fixed_point import solve
 
@@ -38,6 +40,7 @@ class HilberHughesTaylor_d(DySys):
         self.alpha = alpha
         self.beta = (1 - alpha)**2 / 4.
         self.gamma = (1 - 2 * alpha) / 2.
+        self._Msolve = splu(M.tocsc()).solve  # M is constant; factor once
 
     def setKeff(self, h):
         self.Keff = (self.M / self.beta / h**2 +
@@ -75,8 +78,7 @@ class HilberHughesTaylor_d(DySys):
 
         self.v = x[1]
 
-        self.a = solve(self.M,
-                       self.f(0., d) - self.C @ x[1] - self.K @ x[0])
+        self.a = self._Msolve(self.f(0., d) - self.C @ x[1] - self.K @ x[0])
 
         self.setKeff(h)
 
@@ -59,6 +59,15 @@ class LinearDySys(DySys):
     def __len__(self):
         return self.D.shape[0]
 
+    def _like(self, M, D, f):
+        """return a system of the same class and method as self
+
+        but with the given matrices and forcing
+
+        """
+
+        return self.__class__(M, D, f, self.theta, self.definite)
+
     def constrain(self,
                   known: List[int],
                   xknown: Optional[List[float]]=None,
@@ -79,15 +88,13 @@ class LinearDySys(DySys):
 
         M, D = [None if A is None else project(A * U)
                 for A in [self.M, self.D]]
-        sys = self.__class__(
+        sys = self._like(
             M,
             D,
             lambda *args: project(
                 (self.zero if self.f is None else self.f(*args)) -
                 (0 if xknown is None else self.D @ K @ xknown) -
-                (0 if vknown is None else self.M @ K @ vknown)),
-            self.theta,
-            self.definite)
+                (0 if vknown is None else self.M @ K @ vknown)))
 
         sys.reconstitute = partial(self.reconstituter, U, K, xknown)
         sys.project = project
@@ -1,7 +1,8 @@
 import numpy as np
+from scipy.sparse import issparse
 
 from .linear_dysys import LinearDySys
-from ..fixed_point import newton
+from ..fixed_point import newton, reordering_solver
 
 
 class NonlinearSparseDySys(LinearDySys):
@@ -26,32 +27,82 @@ class NonlinearSparseDySys(LinearDySys):
 
         self.F, self.M, self.D = F, M, D
         self.n = D(0, [], [], {}).shape[0] if n is None else n
+        self._linsolve = reordering_solver()  # Jacobians keep pattern
 
     def __len__(self):
         return self.n
 
     def step(self, t, h, xold, tol=1e-3):
-        '''take a backward-Euler step'''
+        '''take a backward-Euler step
+
+        The rate of change passed to F, M, and D is a buffer
+        overwritten at each Newton iteration, so they must copy it if
+        they keep it.
+
+        '''
 
         if h == 0:
             raise ZeroDivisionError
 
-        def arg_map(x):
-            '''approximate the rate of change using backward Euler'''
-            return t + h, x, (x - xold) / h
+        t1 = t + h
+        rate = np.empty(np.shape(xold), np.result_type(xold, float))
+
+        def map_args_into_rate(x):
+            '''approximate the rate of change using backward Euler
+
+            The rate is computed into the same buffer each time, so
+            the returned arguments alias those of the previous call.
+            Newton updates x in place, so it cannot be recognized
+            from one iteration to the next by identity.
+
+            '''
+            np.subtract(x, xold, out=rate)
+            np.divide(rate, h, out=rate)
+            return t1, x, rate
 
         def residual(x):
             # r(x) = F(t, x, (x - xold) / h)
-            return self.F(*arg_map(x))
+            return self.F(*map_args_into_rate(x))
 
         def jacobian(x):
             # r(x + dx) = F(t, x + dx, (x + dx - xold) / h)
 
             #          ~= r(x) + (M / h + D) dx == r + J dx
 
-            return self.M(*arg_map(x)) / h + self.D(*arg_map(x))
+            args = map_args_into_rate(x)
+            return self._pencil(self.M(*args), h, self.D(*args))
+
+        return newton(residual, jacobian, xold, tol,
+                      linsolve=self._linsolve)
+
+    def _pencil(self, M, h, D):
+        '''return M / h + D
+
+        If M and D are compressed sparse matrices of the same format
+        and layout (as is common, e.g. for finite elements), this is
+        computed directly in the data of a matrix of that layout, kept
+        from call to call; otherwise, by sparse arithmetic.
+
+        '''
 
-        return newton(residual, jacobian, xold, tol)
+        if not (issparse(M) and issparse(D) and
+                M.format == D.format in ['csr', 'csc'] and
+                np.array_equal(M.indptr, D.indptr) and
+                np.array_equal(M.indices, D.indices)):
+            return M / h + D
+
+        J = getattr(self, '_J', None)
+        if (J is None or J.format != M.format or
+                J.dtype != np.result_type(M.dtype, D.dtype, float) or
+                not np.array_equal(J.indptr, M.indptr) or
+                not np.array_equal(J.indices, M.indices)):
+            self._J = J = M.__class__(
+                (np.empty(M.nnz, np.result_type(M.dtype, D.dtype, float)),
+                 M.indices.copy(), M.indptr.copy()),
+                M.shape)
+        np.divide(M.data, h, out=J.data)
+        J.data += D.data
+        return J
 
     def equilibrium(self, x0, d=None, **kwargs):
         '''take an infinitely long backward-Euler step
@@ -76,6 +127,7 @@ class NonlinearSparseDySys(LinearDySys):
             return self.D(*arg_map(x))
 
         kwargs.setdefault('tol', 1e-3)
+        kwargs.setdefault('linsolve', self._linsolve)
 
         return newton(residual, jacobian, x0, **kwargs)
 
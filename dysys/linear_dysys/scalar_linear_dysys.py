@@ -15,7 +15,7 @@ from typing import Any, Callable, Optional
 
 from dysys.linear_dysys import LinearDySys
 
-from numpy import inf, interp
+from numpy import asarray, inf
 
 
 class ScalarLinearDySys(LinearDySys):
@@ -25,6 +25,9 @@ class ScalarLinearDySys(LinearDySys):
 
     """
 
+    batches = True              # as arrays, by broadcasting
+    _coefficients = (None, None, None)
+
     def __len__(self):
         return 1
 
@@ -160,6 +163,19 @@ class ScalarLinearDySys(LinearDySys):
 
         return self.forcing(0, inf, y0, d, *args)[1] / self.D
 
+    def harmonic(self, omega):
+        """return the complex harmonic solution
+
+        :param omega: sequence of floats (typically positive)
+
+        :rtype: numpy.ndarray, one solution for each omega, the
+        forcing being evaluated once for the whole sweep
+
+        """
+
+        return (self.forcing(0, inf, None)[1] /
+                (self.D + 1j * asarray(omega) * self.M))
+
     def step(self,
              t: float,
              h: float,
@@ -183,7 +199,17 @@ class ScalarLinearDySys(LinearDySys):
 
         """
 
-        return ((interp(self.theta, [0, 1],
-                        self.forcing(t, h, x, d, *args)) +
-                 (self.M / h - (1 - self.theta) * self.D) * x) /
-                (self.M / h + self.theta * self.D))
+        # The coefficients of the recurrence depend only on h, M, D,
+        # and theta, so are kept from step to step.
+
+        key = h, self.M, self.D, self.theta
+        if self._coefficients[0] != key:
+            denominator = self.M / h + self.theta * self.D
+            self._coefficients = (
+                key, (self.M / h - (1 - self.theta) * self.D) / denominator,
+                1 / denominator)
+        _, a, b = self._coefficients
+
+        fold, fnew = self.forcing(t, h, x, d, *args)
+        return (a * x + b * (fnew if self.theta == 1. else
+                             (1 - self.theta) * fold + self.theta * fnew))
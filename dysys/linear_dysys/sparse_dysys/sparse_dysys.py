@@ -1,20 +1,56 @@
 #!/usr/bin/env python
 
 from functools import partial
-from typing import Dict, Optional, Tuple
+from inspect import signature
+from typing import Callable, Dict, Optional, Tuple
 from warnings import warn
 
 import numpy as np
 
-from scipy.interpolate import interp1d
 from scipy.linalg import eig
-from scipy.sparse import linalg as sla
+from scipy.sparse import csr_matrix, issparse, linalg as sla, tril, triu
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
 from toolz import dissoc, keymap, merge
 
 from ...fixed_point import solve
+from ...util import on_pattern
 from ..linear_dysys import LinearDySys
 
+try:
+    from numba import njit
+except ImportError:             # numba is optional
+    njit = None
+
+
+def _lu_solve_loop(L_data, L_indices, L_indptr, U_data, U_indices, U_indptr,
+                   U_diagonal, perm_r, perm_c, b):
+    """solve by the SuperLU factors Pr A Pc = L U, column by column
+
+    L and U being given without their diagonals, that of L being unit
+
+    """
+
+    y = np.empty_like(b)
+    for i in range(b.size):
+        y[perm_r[i]] = b[i]
+    for j in range(y.size):
+        for k in range(L_indptr[j], L_indptr[j + 1]):
+            y[L_indices[k]] -= L_data[k] * y[j]
+    for j in range(y.size - 1, -1, -1):
+        y[j] /= U_diagonal[j]
+        for k in range(U_indptr[j], U_indptr[j + 1]):
+            y[U_indices[k]] -= U_data[k] * y[j]
+    return y[perm_c]
+
+
+_lu_solve = None if njit is None else njit(cache=True)(_lu_solve_loop)
+
+# The relative tolerance of scipy.sparse.linalg.gmres was renamed from
+# tol to rtol in SciPy 1.12, and tol removed in 1.14.
+
+_GMRES_RTOL = 'rtol' if 'rtol' in signature(sla.gmres).parameters else 'tol'
+
 
 class SparseDySys(LinearDySys):
     """a LinearDySys using sparse matrices and backward Euler
@@ -25,9 +61,212 @@ class SparseDySys(LinearDySys):
 
     """
 
+    batches = True              # as the columns of an array
+    dense_size = 4              # largest system stepped densely
+    compiled = False            # see compile
+
+    def __init__(self, M, D, f=None, theta: float=1.0,
+                 definite: bool=False, dtype=None,
+                 symmetric: Optional[bool]=None, solver: str='direct',
+                 krylov_tol: float=1e-8, reorder: bool=False, **kwargs):
+        """:param M: mass scipy.sparse matrix, or None
+
+        :param D: damping scipy.sparse matrix
+
+        :param f: forcing, as for LinearDySys
+
+        :param theta: float, parameter of theta time-stepping method
+
+        :param definite: bool, for if system is (positive-)definite
+
+        :param dtype: numpy.dtype to which to convert M and D, e.g.
+        numpy.float32 to halve the memory traffic of the products and
+        solves of large systems not needing double precision (SuperLU
+        supports single precision); the right-hand sides of step are
+        converted to it too [default: None, no conversion]
+
+        :param symmetric: bool, for if M and D are symmetric, in which
+        case SuperLU orders the pencils by minimum degree on A^T + A
+        and favours their diagonals as pivots, giving sparser factors;
+        for strongly nonsymmetric systems its default COLAMD remains
+        better [default: definite]
+
+        :param solver: 'direct' or 'krylov', for solving the linear
+        systems of step by sparse-LU or by GMRES preconditioned with an
+        incomplete LU (spilu) of the pencil, computed once for each
+        time-step h and warm-started from the current state; the
+        latter can be much cheaper in memory and time for large
+        three-dimensional problems for which the fill of the complete
+        factors is prohibitive [default: 'direct']
+
+        :param krylov_tol: float, relative tolerance of GMRES for
+        solver='krylov', but no less than a hundred times the machine
+        epsilon of dtype
+
+        :param reorder: bool, for stepping in the reverse
+        Cuthill-McKee ordering of the union of the sparsity patterns
+        of M and D, which narrows the band of the pencils, improving
+        the locality of their products (and the fill of incomplete
+        factors for solver='krylov'); states and forcing are permuted
+        in and out of it at each step [default False]
+
+        """
+
+        self.dtype = dtype
+        self.symmetric = definite if symmetric is None else symmetric
+        self.solver, self.krylov_tol = solver, krylov_tol
+        self.reorder = reorder
+        if dtype is not None:
+            M, D = [None if A is None else A.astype(dtype) for A in [M, D]]
+        super(SparseDySys, self).__init__(M, D, f, theta, definite, **kwargs)
+
     def __len__(self):
         return self.D.shape[0]
 
+    def _like(self, M, D, f):
+        """return a system of the same class and method as self
+
+        but with the given matrices and forcing, and the same options
+        for solving, so that they survive constrain
+
+        """
+
+        return self.__class__(M, D, f, self.theta, self.definite,
+                              dtype=self.dtype, symmetric=self.symmetric,
+                              solver=self.solver, krylov_tol=self.krylov_tol,
+                              reorder=self.reorder)
+
+    def promote(self, dtype=np.float64):
+        """convert M and D to dtype, by default back to double precision
+
+        e.g. to refine a solution obtained in single precision
+
+        """
+
+        self.dtype = dtype
+        self.M, self.D = [None if A is None else A.astype(dtype)
+                          for A in [self.M, self.D]]
+
+    @property
+    def M(self):
+        return self._M
+
+    @M.setter
+    def M(self, M):
+        self._M = _canonical(M)
+        self._forget()
+
+    @property
+    def D(self):
+        return self._D
+
+    @D.setter
+    def D(self, D):
+        self._D = _canonical(D)
+        self._forget()
+
+    def _forget(self):
+        """discard what was computed from the matrices"""
+        for name in ['_memo', '_minus_D', '_shift_inverses', '_dense',
+                     '_Dsolve', '_pattern', '_perm']:
+            self.__dict__.pop(name, None)
+
+    def _set_pattern(self):
+        """set the union of the sparsity patterns of M and D
+
+        and their entries laid out on it
+
+        """
+
+        # TRICKY: Sum the absolute values so that no entry of the
+        # pattern can cancel.
+
+        self._pattern = (abs(self.M) + abs(self.D)).tocsr()
+        self._pattern.sum_duplicates()
+        if self.reorder:
+            self._perm = reverse_cuthill_mckee(self._pattern)
+            self._pattern = self._pattern[self._perm][:, self._perm]
+            self._pattern.sort_indices()
+        else:
+            self._perm = None
+        self._Mdata, self._Ddata = [
+            on_pattern(self._pattern, A if self._perm is None
+                       else A[self._perm][:, self._perm])
+            for A in [self.M, self.D]]
+
+    def _splu(self, A):
+        """return the SuperLU factors of A, ordered as self.symmetric"""
+
+        return sla.splu(A.tocsc(), **({'permc_spec': 'MMD_AT_PLUS_A',
+                                        'options': {'SymmetricMode': True}}
+                                       if self.symmetric else {}))
+
+    def _krylov(self, A) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """return a function solving A x = b by preconditioned GMRES
+
+        given b and an initial guess, the preconditioner being an
+        incomplete LU factorization of A
+
+        """
+
+        A = A.tocsc()
+        ilu = sla.spilu(A, drop_tol=1e-4)
+        preconditioner = sla.LinearOperator(A.shape, ilu.solve,
+                                            dtype=A.dtype)
+
+        # The tolerance cannot be much below the precision of A, e.g.
+        # for dtype=numpy.float32.
+
+        tol = max(self.krylov_tol, 1e2 * np.finfo(A.dtype).eps)
+
+        def solve(b, x0):
+            if b.ndim == 2:     # a batch, column by column
+                return np.column_stack([solve(bj, xj)
+                                        for bj, xj in zip(b.T, x0.T)])
+            x, info = sla.gmres(A, b, x0, restart=30, M=preconditioner,
+                                **{_GMRES_RTOL: tol})
+            if info != 0:
+                raise RuntimeError(
+                    'GMRES did not converge ({0})'.format(info))
+            return x
+
+        return solve
+
+    def compile(self):
+        """step with compiled substitutions through the sparse-LU factors
+
+        rather than through the solve of SuperLU, sparing its
+        dispatch and checking at every step, which dominates for
+        systems of moderate size; the factors are still those of
+        SuperLU, extracted once for each time-step.
+
+        This requires numba.
+
+        """
+
+        if njit is None:
+            raise ImportError('SparseDySys.compile requires numba')
+        self.compiled = True
+        self.__dict__.pop('_memo', None)
+
+    def _compiled_solve(self, A) -> Callable[[np.ndarray], np.ndarray]:
+        """return a function solving A x = b by _lu_solve, given b
+
+        falling back on SuperLU for several right-hand sides at once
+
+        """
+
+        lu = self._splu(A)
+        L, U = tril(lu.L, -1, 'csc'), triu(lu.U, 1, 'csc')
+        substitute = partial(_lu_solve, L.data, L.indices, L.indptr,
+                             U.data, U.indices, U.indptr,
+                             lu.U.diagonal(), lu.perm_r, lu.perm_c)
+
+        def solve(b):
+            return substitute(b) if b.ndim == 1 else lu.solve(b)
+
+        return solve
+
     def step(self,
              t: float,
              h: float,
@@ -41,7 +280,12 @@ class SparseDySys(LinearDySys):
 
         :param h: float > 0, time-step
 
-        :param x: numpy.ndarray, state, initial condition
+        :param x: numpy.ndarray, state, initial condition; or a
+        batch of them, as the columns of an array of shape (n, N),
+        e.g. to march several initial conditions in lockstep, in
+        which case a forcing of shape (n,) is applied to each, and
+        the factors solve for the whole batch at once (except for
+        solver='krylov')
 
         :param d: dict, passed to self.forcing
 
@@ -49,26 +293,118 @@ class SparseDySys(LinearDySys):
         [default: None]
 
         Attempt fast time-stepping, reusing factors if the time-step
-        is the same as on the previous call, using sparse-LU.
+        and theta are the same as on the previous call, using
+        sparse-LU; the factors are discarded if M or D is reassigned.
 
         """
 
-        if not hasattr(self, '_memo') or h != self._memo['h']:
+        if (not hasattr(self, '_memo') or h != self._memo['h'] or
+                self.theta != self._memo['theta']):
             if h == 0.:
                 raise ZeroDivisionError
 
-            M = self.M / h - (1 - self.theta) * self.D
-
-            self._memo = {'h': h, 'M': M}
+            # The pencils are combined on the union of the sparsity
+            # patterns of M and D, as arrays of entries, without
+            # sparse arithmetic merging the patterns for each h.
+
+            if not hasattr(self, '_pattern'):
+                self._set_pattern()
+            data = self._Mdata / h
+            if self.theta != 1.:
+                data -= (1 - self.theta) * self._Ddata
+            M = csr_matrix((data, self._pattern.indices,
+                            self._pattern.indptr), self._pattern.shape)
+
+            M1 = csr_matrix((data + self._Ddata, self._pattern.indices,
+                             self._pattern.indptr), self._pattern.shape)
+
+            # For tiny systems, the dispatch of scipy.sparse and SuperLU
+            # outweighs the arithmetic, so the step is dense, with the
+            # explicit inverse of the pencil.
+
+            dense = len(self) <= self.dense_size
+            krylov = self.solver == 'krylov' and not dense
+            self._memo = {'h': h, 'theta': self.theta,
+                          'M': M.toarray() if dense else M,
+                          'krylov': krylov,
+                          'solve': (np.linalg.inv(M1.toarray()).dot
+                                    if dense else
+                                    self._krylov(M1) if krylov else
+                                    self._compiled_solve(M1)
+                                    if self.compiled else
+                                    self._splu(M1).solve)}
+
+        fold, fnew = self.forcing(t, h, x, d, inputs)
+        f = np.asarray(fnew if self.theta == 1. else
+                       np.multiply(1 - self.theta, fold) +
+                       np.multiply(self.theta, fnew))
+        if f.ndim == 1 and np.ndim(x) == 2:
+            f = f[:, None]      # the same forcing for each of a batch
+
+        perm = self._perm
+        if perm is not None:
+            x = x[perm]
+            if f.ndim:
+                f = f[perm]
+
+        rhs = self._memo['M'] @ x
+        rhs = np.add(
+            rhs, f, out=rhs if rhs.dtype == np.result_type(rhs, f) else None)
+        if self.dtype is not None:
+            rhs = rhs.astype(self.dtype, copy=False)
+        y = (self._memo['solve'](rhs, x) if self._memo['krylov']
+             else self._memo['solve'](rhs))
+
+        if perm is not None:
+            y[perm] = y.copy()
+        return y
+
+    def harmonic(self, omega):
+        """return the complex harmonic solution
+
+        :param omega: sequence of floats (typically positive)
+
+        The pencils D + j w M of the sweep are assembled from the
+        entries of M and D laid out on the union of their sparsity
+        patterns, and SuperLU's fill-reducing column ordering of the
+        first is reused for the rest, as the patterns are all the
+        same; the forcing is evaluated once.
 
-            M1 = M + self.D
-            self._memo["solve"] = sla.splu(M1).solve
+        """
 
-        return self._memo['solve'](
-            self._memo['M'] @ x +
-            interp1d([0, 1],
-                     np.vstack(
-                         self.forcing(t, h, x, d, inputs)).T)(self.theta))
+        if not hasattr(self, '_pattern'):
+            self._set_pattern()
+        pattern, perm = self._pattern, self._perm
+
+        # The pencils and forcing are complex in the precision of the
+        # matrices, e.g. complex64 for dtype=numpy.float32.
+
+        dtype = np.result_type(self._Mdata, self._Ddata, np.complex64)
+        F = np.array(np.broadcast_to(
+            np.asarray(self.forcing(0, np.inf, None)[1], dtype),
+            (len(self),)))
+        if perm is not None:
+            F = F[perm]
+
+        columns = None
+        solutions = []
+        for w in omega:
+            A = csr_matrix(((self._Ddata + 1j * w * self._Mdata).astype(
+                                dtype, copy=False),
+                            pattern.indices, pattern.indptr),
+                           pattern.shape).tocsc()
+            if columns is None:
+                lu = self._splu(A)
+                columns = np.argsort(lu.perm_c)
+                y = lu.solve(F)
+            else:
+                y = np.empty_like(F)
+                y[columns] = sla.splu(A[:, columns],
+                                      permc_spec='NATURAL').solve(F)
+            if perm is not None:
+                y[perm] = y.copy()
+            solutions.append(y)
+        return solutions
 
     def equilibrium(self, x=None, d=None, *args, **kwargs):
         """return the eventual steady-state solution
@@ -81,12 +417,19 @@ class SparseDySys(LinearDySys):
         Further positional arguments are also passed on to
         self.forcing.
 
-        Further keyword arguments passed on to solve.
+        Further keyword arguments passed on to solve; without any, the
+        sparse-LU factors of D are kept for later calls, e.g. with
+        other discrete dynamical variables, until D is reassigned.
 
         """
 
-        return solve(self.D, self.forcing(0, np.inf, x, d, *args)[1],
-                     **kwargs)
+        f = np.asarray(self.forcing(0, np.inf, x, d, *args)[1])
+        if (kwargs or not issparse(self.D) or
+                np.result_type(self.D.dtype, f) != self.D.dtype):
+            return solve(self.D, f, **kwargs)
+        if not hasattr(self, '_Dsolve'):
+            self._Dsolve = self._splu(self.D).solve
+        return self._Dsolve(f)
 
     def eig(self, *args, **kwargs):
         """return the complete spectrum of the system
@@ -94,10 +437,17 @@ class SparseDySys(LinearDySys):
         Any positional and keyword arguments are passed on to
         scipy.linalg.eig.
 
+        The dense (Fortran-ordered) -D and M are kept for later calls,
+        until either is reassigned, and are not overwritten by
+        scipy.linalg.eig.
+
         """
 
-        return eig(-self.D.todense(), self.M.todense(),
-                   *args, **(dissoc(kwargs, 'sigma')))
+        if not hasattr(self, '_dense'):
+            self._dense = [np.asfortranarray(A.toarray())
+                           for A in [-self.D, self.M]]
+        return eig(*self._dense, *args,
+                   **dissoc(kwargs, 'sigma', 'overwrite_a', 'overwrite_b'))
 
     def eigs(self, *args, **kwargs) -> np.ndarray:
         """return the first few modes of the system,
@@ -115,7 +465,7 @@ class SparseDySys(LinearDySys):
         is stable) and represent the reciprocal of decay time
         constants.
 
-        For very small systems, delegate to :method spectrum: and
+        For very small systems, delegate to :method eig: and
         compute all the modes of the discrete system (which involves
         converting to dense form).
 
@@ -131,20 +481,65 @@ class SparseDySys(LinearDySys):
 
         """
 
+        # ARPACK cannot return k >= n - 1 of the n modes, which is
+        # known before factorizing anything.
+
+        k = kwargs.get('k', args[0] if args else 6)
+        if k >= len(self) - 1:
+            return self._dense_eigs(*args[1:], **kwargs)
+        kwargs = merge({'M': self.M, 'sigma': 0.}, kwargs)
+        if kwargs['sigma'] is not None and 'OPinv' not in kwargs:
+            kwargs['OPinv'] = self._shift_invert(kwargs['sigma'])
         try:
-            return sla.eigs(-self.D.tocsc(), *args,
-                            **merge({'M': self.M, 'sigma': 0.}, kwargs))
+            return sla.eigs(self._negative_damping(), *args, **kwargs)
         except TypeError:
             warn('system too small, converting to dense', UserWarning)
-            return self.eig(
-                *args, **keymap(
-                    lambda k: 'right' if k == 'return_eigenvectors' else k,
-                    dissoc(kwargs, 'k', 'M', 'which')))
+            return self._dense_eigs(*args[1:], **kwargs)
+
+    def _dense_eigs(self, *args, **kwargs) -> np.ndarray:
+        """return self.eig for the arguments of self.eigs"""
+
+        return self.eig(
+            *args, **keymap(
+                lambda k: 'right' if k == 'return_eigenvectors' else k,
+                dissoc(kwargs, 'k', 'M', 'OPinv', 'which')))
+
+    def _negative_damping(self):
+        """return -D in CSC format, kept until D is reassigned"""
+
+        if not hasattr(self, '_minus_D'):
+            self._minus_D = (-self.D).tocsc()
+        return self._minus_D
+
+    def _shift_invert(self, sigma: complex) -> sla.LinearOperator:
+        """return the inverse of -D - sigma M, as a LinearOperator
+
+        factored once for each shift sigma and kept for later calls to
+        self.eigs, until M or D is reassigned
+
+        """
+
+        if not hasattr(self, '_shift_inverses'):
+            self._shift_inverses = {}
+        if sigma not in self._shift_inverses:
+            A = (self._negative_damping() - sigma * self.M).tocsc()
+            self._shift_inverses[sigma] = sla.LinearOperator(
+                A.shape, self._splu(A).solve, dtype=A.dtype)
+        return self._shift_inverses[sigma]
+
+
+def _canonical(A):
+    """return A in CSR format if sparse, so as to convert it only once
+
+    rather than in each product or factorization
+
+    """
+
+    return A.tocsr() if issparse(A) else A
 
 
 def demo():
 
-    import pandas as pd
     from scipy.sparse import identity
 
     class Decay(SparseDySys):
@@ -162,16 +557,16 @@ def demo():
     system = Decay()
     ic = 1.0
 
-    history = pd.Series(
-        dict((t, s[0][0]) for (t, s) in
-             system.march_while(lambda state: state[0][0] > ic / 9,
-                                np.array([ic]),
-                                0.1)))
+    times, values = [], []
+    for t, x, _ in system.march_while(lambda x, _: x[0] > ic / 9,
+                                      0.1, np.array([ic])):
+        times.append(t)
+        values.append(x[0])
+    times = np.array(times)
 
-    history = pd.DataFrame({'DySys': history,
-                            'exact': system.exact(np.array(history.index,
-                                                           dtype=float), ic)})
-    print(history)
+    print('{0:>4} {1:>9} {2:>9}'.format('t', 'DySys', 'exact'))
+    for row in zip(times, values, system.exact(times, ic)):
+        print('{0:4.1f} {1:9.6f} {2:9.6f}'.format(*row))
 
     print('Equilibrium: ', system.equilibrium())
     print('Spectrum: {0} (exact: {1})'.format(
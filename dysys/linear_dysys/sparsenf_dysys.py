@@ -2,10 +2,13 @@ from functools import partial
 
 import numpy as np
 
-from scipy.optimize import root
+from scipy.optimize import NoConvergence, newton_krylov, root
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import LinearOperator, spilu
 
 from .linear_dysys import LinearDySys
 from ..fixed_point import newton
+from ..util import matvec, on_pattern
 
 
 class SparseNFDySys(LinearDySys):
@@ -29,17 +32,24 @@ class SparseNFDySys(LinearDySys):
 
     '''
 
-    def __init__(self, M, D, f, f1=None):
+    def __init__(self, M, D, f, f1=None, f_out=False):
         '''
 
         :param f1: the Jacobian derivative of f with respect to x; if
         provided, it will be used to compute the jacobian in the step
         and equilibrium methods
 
+        :param f_out: bool, for if f takes a keyword argument out, a
+        preallocated numpy.ndarray into which to write the forcing,
+        returning it, as a numpy.ufunc does, rather than a new array
+        for each evaluation of the residual
+
         '''
 
         self.f1 = f1
-        super().__init__(M, D, f)
+        self.f_out = f_out
+        super().__init__(*[None if A is None else A.tocsr() for A in [M, D]],
+                         f)
 
     def step(self, t, h, xold, d, tol=1e-3):
 
@@ -53,15 +63,77 @@ class SparseNFDySys(LinearDySys):
         if h == 0:
             raise ZeroDivisionError
 
+        # M / h + D depends only on h (and the matrices), so is kept
+        # from step to step, and M xold / h is constant through the
+        # iterations; the product with the former is by the compiled
+        # kernel of dysys.util.matvec, without the dispatch of
+        # scipy.sparse, since the residual is evaluated every
+        # iteration.
+
+        # M and D are laid out once on the union of their sparsity
+        # patterns (summing absolute values so that no entry cancels),
+        # so that for each new h, M / h + D is formed from the arrays
+        # of entries without sparse arithmetic merging the patterns.
+
+        if (not hasattr(self, '_memo') or self._memo['M'] is not self.M or
+                self._memo['D'] is not self.D):
+            pattern = (abs(self.M) + abs(self.D)).tocsr()
+            pattern.sum_duplicates()
+            self._memo = {'M': self.M, 'D': self.D, 'h': None,
+                          'pattern': pattern,
+                          'Mdata': on_pattern(pattern, self.M),
+                          'Ddata': on_pattern(pattern, self.D)}
+        memo = self._memo
+        if memo['h'] != h:
+            memo['h'] = h
+            memo['A'] = csr_matrix(
+                (memo['Mdata'] / h + memo['Ddata'],
+                 memo['pattern'].indices, memo['pattern'].indptr),
+                memo['pattern'].shape)
+            memo.pop('preconditioner', None)
+        A = memo['A']
+        b = matvec(self.M, xold)
+        b /= h
+        # Newton's solves consume each residual before the next, so
+        # one buffer serves; scipy.optimize.newton_krylov keeps them
+        # to difference.
+
+        buffer = None if self.f1 is None else np.empty_like(b)
+        fbuffer = (np.empty_like(b) if buffer is not None and self.f_out
+                   else None)
+
         def residual(x):
-            return ((self.M / h + self.D) @ x -
-                    self.f(t, x, d) - self.M @ xold / h)
+            r = matvec(A, x, buffer)
+            r -= (self.f(t, x, d) if fbuffer is None
+                  else self.f(t, x, d, out=fbuffer))
+            r -= b
+            return r
 
         def jacobian(x):
-            return (self.M / h + self.D) - self.f1(t, x, d)
-
-        return (root(residual, xold).x if self.f1 is None
-                else newton(residual, jacobian, xold, tol))
+            return A - self.f1(t, x, d)
+
+        # The Jacobians of the iterations of a step differ only
+        # through f1, so modified Newton-iteration reuses the factors
+        # of the first.
+
+        if self.f1 is not None:
+            return newton(residual, jacobian, xold, tol, factor_reuse=True)
+
+        # Without f1, the Jacobian is only available through
+        # differences of the residual, as Jacobian-vector products for
+        # a Krylov method, preconditioned by an incomplete LU of the
+        # linear part M / h + D, which is kept with it for the h.  If
+        # that stalls, as on stiff or badly scaled steps, the step
+        # falls back to the more robust but dense scipy.optimize.root.
+
+        if 'preconditioner' not in memo:
+            memo['preconditioner'] = LinearOperator(
+                A.shape, spilu(A.tocsc(), drop_tol=1e-4).solve, dtype=A.dtype)
+        try:
+            return newton_krylov(residual, xold, method='lgmres', x_tol=tol,
+                                 inner_M=memo['preconditioner'])
+        except NoConvergence:
+            return root(residual, xold).x
 
     def equilibrium(self, x0, d=None, **kwargs):
         '''solve for a steady-state equilibrium
@@ -154,18 +226,31 @@ class SparseNFDySys(LinearDySys):
 
         '''
 
+        if len(known) == 0:     # nothing to project out
+            sys = self.__class__(self.M, self.D, self.f, self.f1, self.f_out)
+            sys.reconstitute = sys.project = lambda x: x
+            return sys
+
         U, K = self.node_maps(known)
         project = partial(self.projector, U)
 
+        # The contributions of the known degrees of freedom are
+        # constant, so compute them once here rather than on every
+        # call of the forcing function.
+
+        fknown = ((0 if xknown is None else self.D @ K @ xknown) +
+                  (0 if vknown is None else self.M @ K @ vknown))
+
         M, D = [None if A is None else project(A * U)
                 for A in [self.M, self.D]]
+        fbuffer = np.empty(self.M.shape[0]) if self.f_out else None
         sys = self.__class__(
             M,
             D,
             lambda *args: project(
-                (0 if self.f is None else self.f(*args)) -
-                (0 if xknown is None else self.D @ K @ xknown) -
-                (0 if vknown is None else self.M @ K @ vknown)),
+                (0 if self.f is None else
+                 self.f(*args) if fbuffer is None else
+                 self.f(*args, out=fbuffer)) - fknown),
             None if self.f1 is None else
             (lambda t, x, d: U.T @ (self.f1(t, sys.reconstitute(x), d) @ U)))
 
@@ -1,5 +1,5 @@
 # flake8: noqa F401
-from .newmark import Newmark
+from .newmark import Newmark, CentralDifference
 from .newmark import (trapezoidal,
                       fox_goodwin,
                       linear_acceleration,
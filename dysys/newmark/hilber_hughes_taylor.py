@@ -6,10 +6,7 @@ generalization of the Newmark method
 
 """
 
-from functools import partial
-
 import numpy as np
-from scipy.interpolate import interp1d
 
 from .newmark import Newmark
 
@@ -28,7 +25,8 @@ class HilberHughesTaylor(Newmark):
         :param K: stiffness scipy.sparse
 
         :param C: damping scipy.sparse matrix, or None, in which case
-        it is constructed as like M but with no nonzero entries
+        it is constructed as like M but with no nonzero entries; a
+        matrix without any nonzero entries is treated as None
 
         :param f: function of time and dict of discrete dynamical
         variables, returning forcing vector, or None in which case a
@@ -44,6 +42,9 @@ class HilberHughesTaylor(Newmark):
 
         """
 
+        if C is not None and C.count_nonzero() == 0:
+            C = None            # skip the damping products in step
+
         self.alpha = alpha
         super(HilberHughesTaylor, self).__init__(
             M, K, C, f, (1 - alpha)**2 / 4., (1 - 2 * alpha) / 2., definite,
@@ -54,69 +55,31 @@ class HilberHughesTaylor(Newmark):
 
         self.prestep(t, h, x, d, *args)
 
-        xt = (x[0] + h * (x[1] + h * (.5 - self.beta) * self.a),
-              x[1] + (1 - self.gamma) * h * self.a)
+        xt = (x[0] + h * (x[1] + self._hmb * self.a),
+              x[1] + self._omgh * self.a)
 
-        rhs = -self.K @ (interp1d([-1, 0],
-                                  np.vstack([x[0], xt[0]]).T)(self.alpha))
+        # The linear interpolation between the start (-1) and the
+        # predictor (0) at alpha is the weighted sum (1 + alpha) * new
+        # - alpha * old; those of the displacement and velocity are
+        # put side by side in the scratch buffers for a single product
+        # with the block [-K, -C].
 
-        if self.C is not None:
-            rhs -= self.C @ (interp1d([-1, 0],
-                                      np.vstack([x[1], xt[1]]).T)(self.alpha))
+        for new, old, out in zip(xt, x, [self._xt, self._vt]):
+            np.multiply(self._1pa, new, out=out)
+            out -= self.alpha * old
+        rhs = self._minus_KC_block() @ (self._xt if self.C is None
+                                        else self._xvt)
 
-        rhs += interp1d([-1, 0],
-                        np.vstack(self.forcing(
-                            t, h, x, d, *args)).T)(self.alpha)
+        if self.forced:
+            fold, fnew = self.forcing(t, h, x, d, *args)
+            rhs += self._1pa * fnew - self.alpha * fold
 
         self.a = self.solve(rhs)
-        return (xt[0] + self.beta * h**2 * self.a,
-                xt[1] + self.gamma * h * self.a)
+        return (xt[0] + self._bhh * self.a,
+                xt[1] + self._gh * self.a)
 
     def setA(self, h):
         super(HilberHughesTaylor, self).setA(h, self.alpha)
 
-    def constrain(self, known, xknown=None, vknown=None, aknown=None):
-        """return a new DySys with constrained degrees of freedom
-
-        having the same class as self.
-
-        :param known: sequence of indices of known degrees of freedom
-
-        :param xknown: corresponding sequence of their values
-        (default: zeros)
-
-        :param vknown: corresponding sequence of their rates of change
-
-        :param aknown: corresponding sequence of their second
-        derivatives
-
-        """
-
-        # TODO gmcbain 2016-07-27: Refactor!
-
-        U, Kn = self.node_maps(known)
-        project = partial(self.projector, U)
-
-        M, K, C = [None if A is None else project(A * U)
-                   for A in [self.M, self.K, self.C]]
-        sys = self.__class__(
-            M,
-            K,
-            C,
-            lambda *args: project(
-                (0 if self.f is None else self.f(*args)) -
-                (0 if xknown is None else self.K @ Kn @ xknown) -
-                (0 if vknown is None else self.C @ Kn @ vknown) -
-                (0 if aknown is None else self.M @ Kn @ aknown)),
-            self.alpha, self.definite)
-
-        reconstituter = partial(self.reconstituter, U, Kn)
-
-        def reconstitute(xv):
-            return (reconstituter(xknown, xv[0]),
-                    reconstituter(vknown, xv[1]))
-
-        sys.reconstitute = reconstitute
-        sys.project = project
-
-        return sys
+    def _like(self, M, K, C, f):
+        return self.__class__(M, K, C, f, self.alpha, self.definite)
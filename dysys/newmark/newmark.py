@@ -1,14 +1,188 @@
 from functools import partial
-from typing import Callable, Optional
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 from warnings import warn
 
 import numpy as np
-from scipy.sparse import block_diag, bmat, linalg as sla, spmatrix
+from scipy.sparse import (csc_matrix, csr_matrix, diags, hstack,
+                          linalg as sla, spmatrix)
 from scipy.sparse.linalg import splu
 
 from dysys.dysys import DySys
 from dysys.fixed_point import solve
 from dysys.linear_dysys import SparseDySys
+from dysys.util import on_pattern
+
+try:
+    from scipy.sparse._sparsetools import csr_matvec
+except ImportError:             # private to SciPy, so may move
+    csr_matvec = None
+
+try:
+    from sksparse.cholmod import analyze, CholmodError
+except ImportError:             # scikit-sparse is optional
+    analyze = None
+
+try:
+    from pypardiso import PyPardisoSolver
+except ImportError:             # pypardiso is optional
+    PyPardisoSolver = None
+
+try:
+    from scikits.umfpack import splu as umfpack_splu
+except ImportError:             # scikit-umfpack is optional
+    umfpack_splu = None
+
+try:
+    from numba import njit
+except ImportError:             # numba is optional
+    njit = None
+
+
+def _matvec_adder(A: spmatrix,
+                  x: np.ndarray,
+                  y: np.ndarray) -> Callable[[], None]:
+    """return a function of no arguments adding A @ x to y in place
+
+    with A, x, and y bound once, going straight to the CSR kernel
+    without allocating a temporary for the product if A is CSR and
+    the dtypes agree
+
+    """
+
+    if (csr_matvec is not None and A.format == 'csr' and
+            A.dtype == x.dtype == y.dtype):
+        return partial(csr_matvec, *A.shape, A.indptr, A.indices, A.data,
+                       x, y)
+
+    def add():
+        y.__iadd__(A @ x)
+
+    return add
+
+
+def _predict_numpy(x, v, a, h, hmb, omgh, xt, vt):
+    """set the Newmark predictors in place
+
+    xt = x + h * (v + hmb * a) and vt = v + omgh * a, where hmb = h *
+    (1/2 - beta) and omgh = (1 - gamma) * h
+
+    """
+
+    np.multiply(a, hmb, out=xt)
+    xt += v
+    xt *= h
+    xt += x
+    np.multiply(a, omgh, out=vt)
+    vt += v
+
+
+def _predict_loop(x, v, a, h, hmb, omgh, xt, vt):
+    """like _predict_numpy, but in a single pass for numba"""
+
+    for i in range(xt.size):
+        xt[i] = x[i] + h * (v[i] + hmb * a[i])
+        vt[i] = v[i] + omgh * a[i]
+
+
+def _correct_numpy(xt, vt, a, bhh, gh, state):
+    """fill a new state block [x; v; a] of shape (3, len(a))
+
+    with the Newmark correctors x = xt + bhh * a and v = vt + gh * a,
+    where bhh = beta * h**2 and gh = gamma * h; the former term
+    vanishing for beta = 0 (e.g. central difference)
+
+    The block is allocated by the caller, in the dtype of the states.
+
+    """
+
+    if bhh == 0.:
+        state[0] = xt
+    else:
+        np.multiply(a, bhh, out=state[0])
+        state[0] += xt
+    np.multiply(a, gh, out=state[1])
+    state[1] += vt
+    state[2] = a
+
+
+def _correct_loop(xt, vt, a, bhh, gh, state):
+    """like _correct_numpy, but in a single pass for numba"""
+
+    if bhh == 0.:
+        for i in range(a.size):
+            state[0, i] = xt[i]
+            state[1, i] = vt[i] + gh * a[i]
+            state[2, i] = a[i]
+    else:
+        for i in range(a.size):
+            state[0, i] = xt[i] + bhh * a[i]
+            state[1, i] = vt[i] + gh * a[i]
+            state[2, i] = a[i]
+
+
+def _march_lumped_loop(h, hmb, omgh, gh, Kp, Ki, Kd, Cp, Ci, Cd, diagonal,
+                       a, X, V):
+    """march the unforced explicit central difference method
+
+    from the initial displacement X[0], velocity V[0], and acceleration
+    a, filling the rest of the rows of X and V and leaving the last
+    acceleration in a
+
+    The stiffness and damping are passed as the indptr, indices, and
+    data of CSR matrices and the acceleration evolution matrix by its
+    diagonal.
+
+    """
+
+    n = a.size
+    xt = np.empty_like(a)
+    vt = np.empty_like(a)
+    for k in range(1, X.shape[0]):
+        for i in range(n):
+            xt[i] = X[k - 1, i] + h * (V[k - 1, i] + hmb * a[i])
+            vt[i] = V[k - 1, i] + omgh * a[i]
+        for i in range(n):
+            r = 0.
+            for j in range(Kp[i], Kp[i + 1]):
+                r -= Kd[j] * xt[Ki[j]]
+            for j in range(Cp[i], Cp[i + 1]):
+                r -= Cd[j] * vt[Ci[j]]
+            a[i] = r / diagonal[i]
+            X[k, i] = xt[i]
+            V[k, i] = vt[i] + gh * a[i]
+
+
+# Fuse the predictor and corrector updates each into one pass over
+# the arrays if numba is available, and compile the whole march of the
+# explicit method.
+
+_predict, _correct = ((_predict_numpy, _correct_numpy) if njit is None else
+                      (njit(cache=True)(_predict_loop),
+                       njit(cache=True)(_correct_loop)))
+
+_march_lumped = None if njit is None else njit(cache=True)(_march_lumped_loop)
+
+
+def _to_csr(A: spmatrix) -> csr_matrix:
+    """return A in CSR format, with 32-bit indices if they suffice
+
+    halving the index traffic of the matrix-vector products
+
+    """
+
+    A = A.tocsr()
+    if A.indices.dtype != np.int32 and max(A.shape[1], A.nnz) < 2**31:
+        A = csr_matrix((A.data,
+                        A.indices.astype(np.int32),
+                        A.indptr.astype(np.int32)), A.shape)
+    return A
+
+
+def _is_diagonal(A: spmatrix) -> bool:
+    """return whether A has no nonzero entries off the diagonal"""
+
+    A = A.tocoo()
+    return bool(np.all((A.row == A.col) | (A.data == 0)))
 
 
 class Newmark(DySys):
@@ -28,6 +202,10 @@ class Newmark(DySys):
 
     """
 
+    factors_cached = 4          # number of time-steps to keep factors for
+    supernodal = 10000          # size from which CHOLMOD goes supernodal
+    dense_size = 500            # size below which eigs may go dense
+
     def __init__(self,
                  M: spmatrix,
                  K: spmatrix,
@@ -45,7 +223,10 @@ class Newmark(DySys):
 
         :param f: function of (time, state (typically ignored), dict
         of discrete dynamical variables), returning forcing vector, or
-        None in which case a ternary zero-function is substituted
+        a numpy.ndarray for a constant forcing (which step then uses
+        without any call), or None in which case a function returning
+        a shared read-only zero vector is substituted (though not
+        actually called by step or prestep)
 
         :param beta: Newmark method parameter, default 0.25 (which,
         with gamma=0.5, is the implicit and unconditionally stable
@@ -55,21 +236,75 @@ class Newmark(DySys):
         required for second order accuracy: Hughes 2000, Table 9.1.1,
         note 3)
 
-        :param definite: bool, for if system is (positive-)definite
+        :param definite: bool, for if system is (positive-)definite,
+        in which case the mass and acceleration evolution matrices are
+        factored by Cholesky decomposition if scikit-sparse is
+        available
 
         """
 
+        # The setters convert to CSR once, so that the products in
+        # step go straight to the CSR kernel without any format
+        # conversion.
+
         self.M, self.K, self.C = M, K, C
-        self.f = f or (lambda *args: self.zero[0])
+        self.f_constant = f if isinstance(f, np.ndarray) else None
+        if self.f_constant is not None:
+            self.f = lambda *args: self.f_constant
+        else:
+            self.f = f or (lambda *args: self._no_force)
+        self.forced = f is not None
+        self._no_force = np.zeros(len(self))
+        self._no_force.setflags(write=False)
         self.beta, self.gamma = beta, gamma
         self.definite = definite
 
     def __len__(self):
         return self.K.shape[0]
 
+    @property
+    def M(self):
+        return self._M
+
+    @M.setter
+    def M(self, M):
+        self._M = None if M is None else _to_csr(M)
+        self._forget()
+
+    @property
+    def K(self):
+        return self._K
+
+    @K.setter
+    def K(self, K):
+        self._K = None if K is None else _to_csr(K)
+        self._forget()
+
+    @property
+    def C(self):
+        return self._C
+
+    @C.setter
+    def C(self, C):
+        self._C = None if C is None else _to_csr(C)
+        self._forget()
+
+    def _forget(self):
+        """discard what was computed from the matrices"""
+        for name in ['_memo', '_last_state', '_Msolve', '_Ksolve',
+                     '_minus_KC', '_pattern', '_analysis', '_columns',
+                     '_shift_inverses', '_sparse_dysys', '_xvt']:
+            self.__dict__.pop(name, None)
+        self._factors = {}
+
     @property
     def zero(self):
-        return (np.zeros(len(self)),)*2
+        """return the zero state, as the rows of one contiguous block
+
+        like those of the states returned by step
+
+        """
+        return tuple(np.zeros((2, len(self))))
 
     def equilibrium(self,
                     x: np.ndarray=None,
@@ -78,49 +313,154 @@ class Newmark(DySys):
                                          np.ndarray):
         """return the eventual steady-state solution
 
-        using self.forcing(np.inf, np.inf, x, d)
+        using self.end_forcing(np.inf, np.inf, x, d)
 
-        :param x: optional initial guess, passed on to self.forcing,
-        where it should be ignored [default: None]
+        :param x: optional initial guess, passed on to
+        self.end_forcing, where it should be ignored [default: None]
 
-        :param d: optional dict, passed on to self.forcing [default:
-        None]
+        :param d: optional dict, passed on to self.end_forcing
+        [default: None]
 
-        Further positional arguments are passed on to self.forcing;
-        keyword arguments to solve.
+        Further positional arguments are passed on to self.end_forcing;
+        keyword arguments to solve.  Without the latter, the factor
+        of the stiffness is kept for later calls.
+
+        See also: equilibria
 
         """
 
-        return (solve(self.K,
-                      self.forcing(np.inf, np.inf, x, d, *args)[1],
-                      **kwargs),
+        f = self.end_forcing(np.inf, np.inf, x, d, *args)
+        return (solve(self.K, f, **kwargs) if kwargs
+                else self.solve_stiffness(f),
                 self.zero[1])
 
+    def equilibria(self,
+                   xs: Optional[Iterable[np.ndarray]],
+                   ds: Iterable[Any],
+                   *args) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """return the eventual steady-state solutions for several cases
+
+        as self.equilibrium for each pair of initial guesses xs (or
+        None) and discrete dynamical variables ds, but solving for all
+        the forcings together against a single factor of the
+        stiffness; e.g. for parameter sweeps
+
+        Further positional arguments are passed on to self.end_forcing.
+
+        """
+
+        ds = list(ds)
+        forcings = np.column_stack([
+            self.end_forcing(np.inf, np.inf, x, d, *args)
+            for x, d in zip([None] * len(ds) if xs is None else xs, ds)])
+        return [(x, self.zero[1])
+                for x in self.solve_stiffness(forcings).T.copy()]
+
+    def end_forcing(self,
+                    t: float,
+                    h: float,
+                    x: Any,
+                    d: Optional[Any]=None,
+                    inputs: Optional[Tuple[Any, Any]]=None) -> np.ndarray:
+        """return the forcing at the end `t + h` of the time-step
+
+        like self.forcing(t, h, x, d, inputs)[1] but without
+        evaluating self.f at the start too, since the Newmark method
+        only needs the end (the start being carried by the
+        acceleration)
+
+        """
+
+        return (self.f(self, t + h, x, d) if inputs is None
+                else self.f(self, t + h, x, d, inputs[1]))
+
     def prestep(self, t, h, x, d, *args):
+        """reset the acceleration and evolution matrix if h changes
+
+        The negated elastic and viscous forces -K @ x[0] - C @ x[1]
+        are taken as one product of the block [-K, -C] and kept for
+        the last state, since a change in h (e.g. for the partial step
+        up to an event and then back again) often comes with the same
+        state; as elsewhere, states are assumed not to be modified in
+        place.
+
+        :rtype: the forcing self.end_forcing(t, h, x, d, *args) if it
+        was evaluated (for step to reuse), else None
+
+        """
+
         if not hasattr(self, '_memo') or self._memo['h'] != h:
-            rhs = self.forcing(t, h, x, d, *args)[1] - self.K @ x[0]
-            if self.C is not None:
-                rhs -= self.C @ x[1]
-            self.a = solve(self.M, rhs)
+            force = (self.end_forcing(t, h, x, d, *args) if self.forced
+                     else None)
+            last = getattr(self, '_last_state', None)
+            if last is not None and last[0] is x[0] and last[1] is x[1]:
+                minus_internal = last[2]
+            else:
+                minus_internal = self._minus_KC_block() @ (
+                    x[0] if self.C is None else np.concatenate(x[:2]))
+                self._last_state = x[0], x[1], minus_internal
+            self.a = self.solve_mass(minus_internal if force is None
+                                     else force + minus_internal)
             self.setA(h)
             self._memo = {'h': h}
+            return force
+
+    def solve_mass(self, b: np.ndarray) -> np.ndarray:
+        """solve M x = b for x
+
+        factoring M on the first call and caching the factor since
+        the mass matrix is constant; if M is diagonal (e.g. lumped)
+        without zeros, just its reciprocal is kept, a massless degree
+        of freedom being left to the factorization to report as
+        singular
+
+        """
+
+        if not hasattr(self, '_Msolve'):
+            if _is_diagonal(self.M) and np.all(self.M.diagonal() != 0):
+                self._Msolve = partial(np.multiply, 1 / self.M.diagonal())
+            else:
+                M = self.M.tocsc()
+                self._Msolve = (splu(M).solve
+                                if analyze is None or not self.definite
+                                else self._analyze(M).cholesky(M))
+        return self._Msolve(b)
+
+    def solve_stiffness(self, b: np.ndarray) -> np.ndarray:
+        """solve K x = b for x, b having one column per right-hand side
+
+        factoring K on the first call and caching the factor, as for
+        solve_mass
+
+        """
+
+        if not hasattr(self, '_Ksolve'):
+            K = self.K.tocsc()
+            self._Ksolve = (splu(K).solve
+                            if analyze is None or not self.definite
+                            else self._analyze(K).cholesky(K))
+        return self._Ksolve(b)
 
     def step(self, t, h, x, d, *args):
         'evolve from displacement x at time t to t+h'
 
-        self.prestep(t, h, x, d, *args)
+        force = self.prestep(t, h, x, d, *args)
+        self._set_buffers(np.result_type(x[0], x[1], self.a))
 
-        xt = (x[0] + h * (x[1] + h * (.5 - self.beta) * self.a),
-              x[1] + (1 - self.gamma) * h * self.a)
+        xt, vt = self._xt, self._vt
+        _predict(x[0], x[1], self.a, h, self._hmb, self._omgh, xt, vt)
 
-        rhs = self.forcing(t, h, x, d, *args)[1] - self.K @ xt[0]
+        rhs = self._assemble_rhs(t, h, x, d, *args, force=force)
 
-        if self.C is not None:
-            rhs -= self.C @ xt[1]
+        # Correct into a fresh block, since the states are yielded by
+        # march; the displacement, velocity, and acceleration are
+        # kept together for the next predictor.
 
-        self.a = self.solve(rhs)
-        return (xt[0] + self.beta * h**2 * self.a,
-                xt[1] + self.gamma * h * self.a)
+        a = self.solve(rhs)
+        state = np.empty((3, a.size), np.result_type(xt, vt, a))
+        _correct(xt, vt, a, self._bhh, self._gh, state)
+        self.a = state[2]
+        return state[0], state[1]
 
     def setA(self, h, alpha=0.):
         """set the acceleration evolution matrix
@@ -131,12 +471,208 @@ class Newmark(DySys):
         HilberHughesTaylor subclass, defaulting to 0., in which case
         Hilber, Hughes, & Taylor's alpha-method degenerates to Newmark
 
+        The factors of the matrices for the last few (h, alpha) are
+        cached, the mass, damping, and stiffness being constant; this
+        saves refactoring for the partial steps up to events, repeated
+        marches, etc.
+
+        The scalar coefficients of the predictor and corrector are
+        also set here, since they only change with h, as is the
+        function assembling the right-hand side.  The scratch buffers
+        for the predictors and right-hand side are allocated on the
+        first call, in the dtype of the acceleration, and kept for the
+        life of the system unless the dtype of the states changes.
+
         """
 
-        A = self.M + (1 + alpha) * h**2 * self.beta * self.K
-        if self.C is not None:
-            A += (1 + alpha) * h * self.gamma * self.C
-        self.solve = splu(A).solve
+        self._hmb = h * (.5 - self.beta)
+        self._bhh = self.beta * h**2
+        self._gh = self.gamma * h
+        self._omgh = (1 - self.gamma) * h
+        self._1pa = 1 + alpha
+        self._set_buffers(np.result_type(self.a))
+
+        key = h, alpha
+        if key not in self._factors:
+            if len(self._factors) >= self.factors_cached:
+                del self._factors[next(iter(self._factors))]  # oldest
+
+            # Since M, K, and C are laid out on their common sparsity
+            # pattern, A is assembled as a linear combination of
+            # their data.
+
+            if not hasattr(self, '_pattern'):
+                self._set_pattern()
+            data = self._Kdata * (self._1pa * self._bhh)
+            data += self._Mdata
+            if self.C is not None:
+                data += (self._1pa * self._gh) * self._Cdata
+            self._factors[key] = self._factorize(csr_matrix(
+                (data, self._pattern.indices, self._pattern.indptr),
+                self._pattern.shape))
+        self.solve = self._factors[key]
+        self._assemble_rhs = self._rhs_assembler()
+
+    def _set_buffers(self, dtype: np.dtype):
+        """allocate the scratch buffers for the predictors and right-hand side
+
+        in dtype, e.g. complex for complex states or forcing, unless
+        already allocated in it
+
+        """
+
+        if not hasattr(self, '_xvt') or self._xvt.dtype != dtype:
+            buffers = np.empty((3, len(self)), dtype)
+            self._xt, self._vt, self._rhs = buffers
+            self._xvt = buffers[:2].reshape(-1)  # xt & vt, contiguously
+            if hasattr(self, '_assemble_rhs'):
+                self._assemble_rhs = self._rhs_assembler()
+
+    def _rhs_assembler(self) -> Callable[..., np.ndarray]:
+        """return a function of (t, h, x, d, *args, force=None) for step
+
+        returning the right-hand side forcing - K @ xt - C @ vt, in
+        the scratch buffer, having the damping and forcing terms
+        specialized out if absent; the forcing is taken from force if
+        already evaluated (by prestep)
+
+        The two products are taken as the single product of the
+        negated block [-K, -C] with the contiguous [xt; vt],
+        accumulated onto the forcing by a kernel call with all its
+        arrays bound here, once per time-step.
+
+        """
+
+        rhs = self._rhs
+        add_internal = _matvec_adder(
+            self._minus_KC_block(),
+            self._xt if self.C is None else self._xvt,
+            rhs)
+
+        if self.f_constant is not None:
+            def assemble(*_, **__):
+                np.copyto(rhs, self.f_constant)
+                add_internal()
+                return rhs
+        elif self.forced:
+            end_forcing = self.end_forcing
+
+            def assemble(t, h, x, d, *args, force=None):
+                np.copyto(rhs, end_forcing(t, h, x, d, *args)
+                          if force is None else force)
+                add_internal()
+                return rhs
+        else:
+            def assemble(*_, **__):
+                rhs.fill(0.)
+                add_internal()
+                return rhs
+
+        return assemble
+
+    def _minus_KC_block(self) -> csr_matrix:
+        """return the negated block [-K, -C], or just -K if undamped
+
+        built on the first call and kept
+
+        """
+
+        if not hasattr(self, '_minus_KC'):
+            self._minus_KC = -(self.K if self.C is None
+                               else hstack([self.K, self.C], format='csr'))
+        return self._minus_KC
+
+    def _set_pattern(self):
+        """set the union of the sparsity patterns of M, K, and C
+
+        and their entries laid out on it
+
+        """
+
+        # TRICKY: Sum the absolute values so that no entry of the
+        # pattern can cancel.
+
+        self._pattern = sum(abs(B) for B in [self.M, self.K, self.C]
+                            if B is not None).tocsr()
+        self._pattern.sum_duplicates()
+        self._Mdata, self._Kdata, self._Cdata = [
+            None if B is None else on_pattern(self._pattern, B)
+            for B in [self.M, self.K, self.C]]
+
+    def _factorize(self, A: spmatrix) -> Callable[[np.ndarray], np.ndarray]:
+        """return a function solving A x = b for x, given b
+
+        If the system is definite and scikit-sparse is available, A
+        is factored by Cholesky decomposition, reusing the symbolic
+        analysis (fill-reducing ordering, etc.) from the first call
+        since A always has the sparsity of M + K + C whatever h is.
+
+        Otherwise A is factored by MKL PARDISO if pypardiso is
+        available, else UMFPACK if scikit-umfpack is, else SuperLU,
+        which likewise reuses the column ordering from the first call.
+
+        """
+
+        if self.definite and analyze is not None:
+            if not hasattr(self, '_analysis'):
+                self._analysis = self._analyze(A.tocsc())
+            return self._analysis.cholesky(A.tocsc())
+        if PyPardisoSolver is not None:
+            solver = PyPardisoSolver()
+            solver.factorize(A)
+            return partial(solver.solve, A)
+        if umfpack_splu is not None:
+            return umfpack_splu(A.tocsc()).solve
+        return self._splu(A.tocsc())
+
+    def _splu(self, A: spmatrix) -> Callable[[np.ndarray], np.ndarray]:
+        """return a function solving A x = b for x by SuperLU
+
+        The fill-reducing column ordering of the first factorization
+        is kept, and later matrices are permuted by it before being
+        factored in their natural order, skipping the ordering.
+
+        """
+
+        if not hasattr(self, '_columns'):
+            lu = splu(A)
+            self._columns = np.argsort(lu.perm_c)
+            return lu.solve
+
+        columns = self._columns
+        lu = splu(A[:, columns], permc_spec='NATURAL')
+
+        def solve(b: np.ndarray) -> np.ndarray:
+            x = np.empty_like(b)
+            x[columns] = lu.solve(b)
+            return x
+
+        return solve
+
+    def _analyze(self, A: spmatrix):
+        """return the CHOLMOD symbolic analysis of A
+
+        using the supernodal mode for systems of at least
+        self.supernodal degrees of freedom and the simplicial below,
+        and METIS ordering if CHOLMOD was built with it
+
+        """
+
+        mode = 'supernodal' if A.shape[0] >= self.supernodal else 'simplicial'
+        try:
+            return analyze(A, mode=mode, ordering_method='metis')
+        except CholmodError:    # not built with METIS
+            return analyze(A, mode=mode)
+
+    def _like(self, M, K, C, f):
+        """return a system of the same class and method as self
+
+        but with the given matrices and forcing
+
+        """
+
+        return self.__class__(M, K, C, f,
+                              self.beta, self.gamma, self.definite)
 
     def constrain(self, known, xknown=None, vknown=None, aknown=None):
         """return a new DySys with constrained degrees of freedom
@@ -158,22 +694,40 @@ class Newmark(DySys):
         # TODO gmcbain 2016-07-27: Refactor!
 
         U, Kn = self.node_maps(known)
-        project = partial(self.projector, U)
+
+        # Since U and Kn are just selections of columns of the
+        # identity, projecting is gathering and reconstituting
+        # scattering.
+
+        free = U.tocsc().indices
+
+        def project(y):
+            return y[free]
+
+        # The forces due to the known degrees of freedom are constant.
+
+        fknown = sum(A @ Kn @ k for A, k in [(self.K, xknown),
+                                             (self.C, vknown),
+                                             (self.M, aknown)]
+                     if A is not None and k is not None)
+        fknown = project(fknown) if np.ndim(fknown) else 0.
+
+        def f(sys, t, x, d, u=None):
+            return project(self.f(sys, t, x, d) if u is None
+                           else self.f(sys, t, x, d, u)) - fknown
 
         M, K, C = [None if A is None else project(A * U)
                    for A in [self.M, self.K, self.C]]
-        sys = self.__class__(
-            M,
-            K,
-            C,
-            lambda *args: project(
-                (0 if self.f is None else self.f(*args)) -
-                (0 if xknown is None else self.K @ Kn @ xknown) -
-                (0 if vknown is None else self.C @ Kn @ vknown) -
-                (0 if aknown is None else self.M @ Kn @ aknown)),
-            self.beta, self.gamma, self.definite)
-
-        reconstituter = partial(self.reconstituter, U, Kn)
+        sys = self._like(M, K, C,
+                         f if self.f_constant is None
+                         else project(self.f_constant) - fknown)
+
+        def reconstituter(k, u):
+            y = np.zeros(len(self), np.result_type(u, 0. if k is None else k))
+            y[free] = u
+            if k is not None:
+                y[known] = k
+            return y
 
         def reconstitute(xv):
             return (reconstituter(xknown, xv[0]),
@@ -185,22 +739,38 @@ class Newmark(DySys):
         return sys
 
     def eigs(self, *args, **kwargs):
-        """return the first few modes of the system"""
+        """return the first few modes of the system
+
+        :param lobpcg: bool, use LOBPCG rather than shift-inverted
+        ARPACK, avoiding factorizing the stiffness matrix; only for
+        definite undamped systems [default False]
 
+        """
+
+        if kwargs.pop('lobpcg', False) and self.definite and self.C is None:
+            return self._lobpcg(*args, **kwargs)
         if 'sigma' not in kwargs:  # inverse iteration
             kwargs['sigma'] = 0.   # Hughes (2000, §10.5.2)
         if self.C is None:
             kwargs['M'] = self.M
+            if 'OPinv' not in kwargs:
+                kwargs['OPinv'] = self._shift_invert(kwargs['sigma'])
+            eigen = sla.eigsh if self.definite else sla.eigs
             try:
-                retval = ((sla.eigsh if self.definite else sla.eigs)
-                          (-self.K, *args, **kwargs))
+                try:
+                    retval = eigen(-self.K, *args, **kwargs)
+                except sla.ArpackNoConvergence:
+                    retval = self._arpack_retry(eigen, -self.K,
+                                                *args, **kwargs)
                 if kwargs.get('return_eigenvectors', False):
                     return np.sqrt(-retval[0]), retval[1]
                 else:
                     return np.sqrt(-retval)
             except ValueError:
+                if len(self) >= self.dense_size:
+                    raise
                 warn('system too small, converting to dense', UserWarning)
-                for k in ['k', 'M', 'which']:
+                for k in ['k', 'M', 'OPinv', 'which']:
                     if k in kwargs:
                         del kwargs[k]
                 kwargs['right'] = kwargs.pop('return_eigenvectors')
@@ -209,22 +779,187 @@ class Newmark(DySys):
 
             return self.to_sparse_dysys().eigs(*args, **kwargs)
 
+    def _arpack_retry(self, eigen, A, *args, **kwargs):
+        """call ARPACK again after it failed to converge
+
+        first with more Lanczos or Arnoldi vectors (up to 4 k + 20),
+        then also with a tolerance no tighter than 1e-8
+
+        """
+
+        k = args[0] if args else kwargs.get('k', 6)
+        kwargs['ncv'] = max(min(len(self), 4 * k + 20),
+                            kwargs.get('ncv') or 0)
+        try:
+            return eigen(A, *args, **kwargs)
+        except sla.ArpackNoConvergence:
+            kwargs['tol'] = max(kwargs.get('tol', 0.), 1e-8)
+            return eigen(A, *args, **kwargs)
+
+    def _shift_invert(self, sigma: float) -> sla.LinearOperator:
+        """return the inverse of -K - sigma M, as a LinearOperator
+
+        factored once for each shift sigma and kept for later calls to
+        self.eigs
+
+        """
+
+        if not hasattr(self, '_shift_inverses'):
+            self._shift_inverses = {}
+        if sigma not in self._shift_inverses:
+            A = (-self.K - sigma * self.M).tocsc()
+            self._shift_inverses[sigma] = sla.LinearOperator(
+                A.shape, splu(A).solve, dtype=A.dtype)
+        return self._shift_inverses[sigma]
+
+    def _lobpcg(self,
+                k: int=6,
+                return_eigenvectors: bool=False,
+                tol: Optional[float]=None,
+                maxiter: int=200):
+        """return the k lowest modes by LOBPCG
+
+        preconditioned by the inverse of the diagonal of the stiffness
+
+        """
+
+        X = np.random.default_rng(0).standard_normal((len(self), k))
+        w, v = sla.lobpcg(self.K, X, B=self.M,
+                          M=sla.aslinearoperator(
+                              diags(1 / self.K.diagonal())),
+                          tol=tol, maxiter=maxiter, largest=False)
+        return (np.sqrt(w), v) if return_eigenvectors else np.sqrt(w)
+
     def to_sparse_dysys(self, theta: float=0.5) -> SparseDySys:
         """return an equivalent SparseDySys
 
-        by introducing the rate of change as an auxiliary variable
+        by introducing the rate of change as an auxiliary variable;
+        kept for each theta, so that e.g. repeated calls of eigs
+        share it
 
         """
 
-        return SparseDySys(block_diag([self.identity,
-                                       self.M]).tocsc(),
-                           bmat([[None, -self.identity],
-                                 [self.K, self.C]]),
+        if not hasattr(self, '_sparse_dysys'):
+            self._sparse_dysys = {}
+        if theta not in self._sparse_dysys:
+            self._sparse_dysys[theta] = self._to_sparse_dysys(theta)
+        return self._sparse_dysys[theta]
+
+    def _to_sparse_dysys(self, theta: float) -> SparseDySys:
+        """build the SparseDySys for to_sparse_dysys"""
+
+        # The blocks are laid out column by column directly rather
+        # than through block_diag and bmat, which go via COO and sort.
+
+        n = len(self)
+        eye = np.arange(n)
+        M = self.M.tocsc()
+        mass = csc_matrix((np.concatenate([np.ones(n), M.data]),
+                           np.concatenate([eye, M.indices + n]),
+                           np.concatenate([eye, M.indptr + n])),
+                          (2 * n, 2 * n))
+
+        # The j-th column of the second block-column holds the -1 from
+        # -identity in row j, above the j-th column of C.
+
+        K = self.K.tocsc()
+        C = csc_matrix((n, n)) if self.C is None else self.C.tocsc()
+        indptr = C.indptr + np.arange(n + 1)
+        indices = np.empty(C.nnz + n, K.indices.dtype)
+        data = np.empty(C.nnz + n, np.result_type(K.dtype, C.dtype, float))
+        indices[indptr[:-1]], data[indptr[:-1]] = eye, -1.
+        below = np.arange(C.nnz) + np.repeat(eye + 1, np.diff(C.indptr))
+        indices[below], data[below] = C.indices + n, C.data
+        stiffness = csc_matrix((np.concatenate([K.data, data]),
+                                np.concatenate([K.indices + n, indices]),
+                                np.concatenate([K.indptr,
+                                                K.nnz + indptr[1:]])),
+                               (2 * n, 2 * n))
+
+        return SparseDySys(mass,
+                           stiffness,
                            lambda *fargs: np.concatenate([self.zero[0],
                                                           self.f(*fargs)]),
                            theta)
 
 
+class CentralDifference(Newmark):
+    """a Newmark system with beta = 0
+
+    which is explicit if the mass and damping matrices are diagonal
+    (e.g. lumped), the acceleration evolution matrix then being
+    diagonal too so that the solve is just a division (Hughes 2000,
+    §9.1.2)
+
+    """
+
+    def __init__(self,
+                 M: spmatrix,
+                 K: spmatrix,
+                 C: Optional[spmatrix]=None,
+                 f: Optional[Callable]=None,
+                 beta: float=0.,
+                 gamma: float=0.5,
+                 definite: bool=False):
+        super(CentralDifference, self).__init__(M, K, C, f, beta, gamma,
+                                                definite)
+
+    @property
+    def lumped(self) -> bool:
+        """whether the mass and damping are diagonal, with beta = 0"""
+        if not hasattr(self, '_lumped'):
+            self._lumped = self.beta == 0 and all(
+                A is None or _is_diagonal(A) for A in [self.M, self.C])
+        return self._lumped
+
+    def _forget(self):
+        super(CentralDifference, self)._forget()
+        self.__dict__.pop('_lumped', None)
+
+    def _factorize(self, A: spmatrix) -> Callable[[np.ndarray], np.ndarray]:
+        if self.lumped:
+            diagonal = A.diagonal()
+            return lambda b: b / diagonal
+        return super(CentralDifference, self)._factorize(A)
+
+    def march_array(self,
+                    h: float,
+                    n_steps: int,
+                    x: Optional[Tuple[np.ndarray, np.ndarray]]=None,
+                    d: Optional[Any]=None,
+                    **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """return the first n_steps of self.march as arrays
+
+        as DySys.march_array, the states having shape (2, len(self))
+        for the displacement and velocity, but if the system is lumped
+        and unforced and numba is available, taking the whole march in
+        compiled code
+
+        """
+
+        if _march_lumped is None or not self.lumped or self.forced or kwargs:
+            return super(CentralDifference, self).march_array(
+                h, n_steps, x, d, **kwargs)
+
+        x = self.zero if x is None else x
+        self.prestep(0., h, x, d)
+        C = csr_matrix(self.K.shape) if self.C is None else self.C
+        diagonal = self.M.diagonal()
+        if self.C is not None:
+            diagonal = diagonal + C.diagonal() * self._gh
+
+        dtype = np.result_type(x[0], x[1], self.a, diagonal)
+        XV = np.empty((n_steps + 1, 2, len(self)), dtype)
+        XV[0] = x
+        a = np.array(self.a, dtype=dtype)
+        _march_lumped(h, self._hmb, self._omgh, self._gh,
+                      self.K.indptr, self.K.indices, self.K.data,
+                      C.indptr, C.indices, C.data, diagonal, a,
+                      XV[:, 0], XV[:, 1])
+        self.a = a
+        return np.cumsum(np.r_[0., np.full(n_steps, h)]), XV
+
+
 # Define special cases, as per Hughes (2000, Table 9.1.1, p. 493)
 
 trapezoidal = partial(Newmark, beta=.25, gamma=.5)
@@ -233,4 +968,4 @@ linear_acceleration = partial(Newmark, beta=1/6, gamma=.5)
 
 fox_goodwin = partial(Newmark, beta=1/12, gamma=.5)
 
-central_difference = partial(Newmark, beta=0, gamma=.5)
+central_difference = partial(CentralDifference, beta=0, gamma=.5)
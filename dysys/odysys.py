@@ -1,6 +1,7 @@
 from functools import partial
 
 import numpy as np
+from scipy import integrate
 from scipy.integrate import ode
 from scipy.optimize import root
 
@@ -31,6 +32,7 @@ class ODySys(DySys):
         self._ode = ode(self.f, self.jac)
         self.set_f_params(*(f_args or []))
         self.set_jac_params(*(jac_args or []))
+        self._last = None       # time and state at end of last step
 
     def __getattr__(self, name):
         """delegate to ode"""
@@ -40,17 +42,26 @@ class ODySys(DySys):
         x, d = super(ODySys, self).handle_event(f, t, x, d)
         self.set_f_params(*d.get('f_args', []))
         self.set_jac_params(*d.get('jac_args', []))
+        self._last = None
         return x, d
 
     def step(self, t, h, x, d):
-        """estimate the next state"""
-        self.set_initial_value(x, t)
+        """estimate the next state
+
+        continuing the integration from the previous step, without
+        resetting the integrator, if that ended at time t with state x
+
+        """
+
+        if self._last is None or self._last[0] != t or self._last[1] is not x:
+            self.set_initial_value(x, t)
 
         if h == 0:
             raise ZeroDivisionError
 
         xnext = self.integrate(self.t + h)
         if self.successful():
+            self._last = self.t, xnext
             return xnext
         else:
             raise RuntimeError
@@ -72,3 +83,117 @@ class ODySys(DySys):
                     self.f_params,
                     jac=lambda y: self.jac(np.inf, y, *self.jac_params),
                     **kwargs).x
+
+
+_IMPLICIT = (integrate.Radau, integrate.BDF, integrate.LSODA)  # taking jac
+
+
+class IVPDySys(DySys):
+
+    def __init__(self, f, jac=None, f_args=None, jac_args=None,
+                 method='BDF', jac_sparsity=None, **options):
+
+        """Encapsulate the solvers of scipy.integrate.solve_ivp for DySys
+
+        like ODySys, but with the newer solvers (BDF, LSODA, Radau,
+        RK45, ...), which unlike scipy.integrate.ode can take a
+        sparse Jacobian or its sparsity
+
+        :param f: function of time, state, and possibly other
+        arguments, listed in f_args
+
+        :param jac: optional function of time, state, and possibly
+        other arguments, listed in jac_args, or constant matrix
+
+        :param f_args: optional list of additional positional
+        arguments for f
+
+        :param jac_args: optional list of additional positional
+        arguments for jac
+
+        :param method: solver, as for solve_ivp, either a subclass of
+        scipy.integrate.OdeSolver or the name of one [default: 'BDF']
+
+        :param jac_sparsity: optional sparsity of the Jacobian, e.g. a
+        scipy.sparse matrix, for its estimation by finite differences
+        when jac is not given; ignored otherwise
+
+        The Jacobian and its sparsity are only passed to the implicit
+        solvers (Radau, BDF, LSODA), the explicit having no use for
+        them.
+
+        Further keyword arguments (e.g. rtol, atol, max_step) are
+        passed on to the solver.
+
+        The solver is kept and continued from one step to the next,
+        its adapted internal step being independent of the time-step;
+        it is only restarted if the initial condition of a step is not
+        the state returned by the previous step (e.g. after an event).
+
+        """
+
+        self.f, self.jac = f, jac
+        self.f_args, self.jac_args = list(f_args or []), list(jac_args or [])
+        self.method = (getattr(integrate, method) if isinstance(method, str)
+                       else method)
+        self.jac_sparsity = jac_sparsity
+        self.options = options
+        self._solver = self._last = None
+
+    def handle_event(self, f, t, x, d):
+        x, d = super(IVPDySys, self).handle_event(f, t, x, d)
+        self.f_args = list(d.get('f_args', []))
+        self.jac_args = list(d.get('jac_args', []))
+        self._last = None
+        return x, d
+
+    def _start(self, t, x):
+        """start a new solver at time t from state x"""
+
+        options = dict(self.options)
+        if issubclass(self.method, _IMPLICIT):
+            if callable(self.jac):
+                options['jac'] = lambda t, y: self.jac(t, y, *self.jac_args)
+            elif self.jac is not None:
+                options['jac'] = self.jac
+            elif self.jac_sparsity is not None:
+                options['jac_sparsity'] = self.jac_sparsity
+        self._solver = self.method(lambda t, y: self.f(t, y, *self.f_args),
+                                   t, x, np.inf, **options)
+
+    def step(self, t, h, x, d):
+        """estimate the next state"""
+
+        if h == 0:
+            raise ZeroDivisionError
+
+        if self._last is None or self._last[0] != t or self._last[1] is not x:
+            self._start(t, x)
+        solver, t1 = self._solver, t + h
+        while solver.t < t1:
+            message = solver.step()
+            if solver.status == 'failed':
+                raise RuntimeError(message)
+        xnext = (solver.y.copy() if solver.t == t1
+                 else solver.dense_output()(t1))
+        self._last = t1, xnext
+        return xnext
+
+    def equilibrium(self, y0, d=None, **kwargs):
+        """return a steady-state solution
+
+        :param y0: one-dimensional numpy.ndarray, initial guess
+
+        :param d: dict, discrete dynamical variables, currently
+        ignored
+
+        Further keyword-arguments passed on to scipy.optimize.root.
+
+        """
+
+        return root(partial(self.f, np.inf),
+                    y0,
+                    tuple(self.f_args),
+                    jac=((lambda y, *_: self.jac(np.inf, y, *self.jac_args))
+                         if callable(self.jac) else None),
+                    **kwargs).x
@@ -1,4 +1,11 @@
-from toolz import partitionby
+from itertools import groupby
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:             # numba is optional
+    njit = None
 
 
 def segment(history, period):
@@ -11,8 +18,74 @@ def segment(history, period):
 
     :rtype: iterable of iterables
 
+    If the history is a numpy.ndarray, with the times in its first
+    column, the periods are found by :func:`segment_array` and
+    yielded as slices of it.
+
     '''
 
     # TODO gmcbain 2017-02-24: Reverse order of arguments.
 
-    return partitionby(lambda ev: int(ev[0] / period), history)
+    if isinstance(history, np.ndarray):
+        if history.shape[0] == 0:  # no periods, as from groupby
+            return
+        bounds = segment_array(history[:, 0], period)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            yield history[start:stop]
+        return
+
+    frequency = 1. / period
+
+    def key(ev):
+        return int(ev[0] * frequency)
+
+    # The groups of groupby share the underlying iterator, so each is
+    # materialized before the next is drawn, as with
+    # toolz.partitionby.
+
+    for _, group in groupby(history, key):
+        yield tuple(group)
+
+
+def segment_array(times, period):
+    '''return the bounds of the periods of an array of times
+
+    :param times: array_like, monotonically nondecreasing
+
+    :param period: positive float
+
+    :rtype: numpy.ndarray of int, starting with 0 and ending with
+    len(times), the i-th period running from the i-th bound up to
+    but not including the next
+
+    '''
+
+    times = np.asarray(times)
+    if (_segment_bounds is not None and times.size and
+            times.dtype in (np.float32, np.float64)):  # as numba types
+        return _segment_bounds(times, 1. / period)
+
+    bucket = (times * (1. / period)).astype(np.int64)
+    return np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1,
+                           [len(bucket)]))
+
+
+def _segment_bounds_loop(times, frequency):
+    """find the bounds of segment_array in a single pass, for numba"""
+
+    bounds = np.empty(times.size + 1, np.int64)
+    bounds[0] = 0
+    k = 1
+    previous = int(times[0] * frequency)
+    for i in range(1, times.size):
+        bucket = int(times[i] * frequency)
+        if bucket != previous:
+            bounds[k] = i
+            k += 1
+            previous = bucket
+    bounds[k] = times.size
+    return bounds[:k + 1]
+
+
+_segment_bounds = None if njit is None else njit(cache=True)(
+    _segment_bounds_loop)
@@ -14,7 +14,7 @@ most of the methods of this class work with.
 
 """
 
-from typing import Any, Callable, List, Optional, Sequence
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -40,13 +40,45 @@ class SignalFlowPathSys(DySys):
         self.systems = systems
         self.functions = (functions if functions is not None
                           else ([autonomous()] * (len(self) - 1)))
+        self._last = None       # time, state & outputs at end of last step
+
+    @property
+    def systems(self) -> Tuple[DySys, ...]:
+        return self._systems
+
+    @systems.setter
+    def systems(self, systems: Sequence[DySys]):
+        """set the subsystems, binding their step and equilibrium methods
+
+        once here rather than looking them up at every step, and
+        taking their zero states
+
+        The subsystems are kept as a tuple, so that they can only be
+        changed by setting them again, which binds them afresh.
+
+        """
+        systems = tuple(systems)
+        self._systems = systems
+        self._steps = [s.step for s in systems]
+        self._equilibria = [s.equilibrium for s in systems]
+        self._zero = [s.zero for s in systems]
 
     def __len__(self):
         return len(self.systems)
 
     @property
     def zero(self):
-        return [s.zero for s in self.systems]
+        """return the zero state, copied from that of the subsystems
+
+        as taken when they were set
+
+        """
+        return [_copy(z) for z in self._zero]
+
+    def handle_event(self, f, t, x, d):
+        x, d = super(SignalFlowPathSys, self).handle_event(f, t, x, d)
+        self._last = None
+        return x, d
 
     def step(self,
              t: float,
@@ -56,6 +88,14 @@ class SignalFlowPathSys(DySys):
              inputs: Optional[Any]=None) -> List[Any]:
         """estimate the state after a step in time
 
+        The outputs of the mappings between the systems at the end of
+        the step are kept, to be reused as those at the start of the
+        next if that continues from time t + h and the states of the
+        subsystems returned, compared one by one by identity; so a
+        state replaced in the returned list, e.g. x[i] = ..., is
+        detected, but the arrays of the states must not be modified
+        in place between steps.
+
         """
 
         # TODO gmcbain 2016-11-21: Could this be expressed with
@@ -63,18 +103,28 @@ class SignalFlowPathSys(DySys):
 
         # TOOD gmcbain 2017-10-03: …or toolz.itertoolz.accumulate?
 
-        xnew = [self.systems[0].step(t, h, x[0], d, inputs)]
-        for i in range(1, len(self)):
-            xnew.append(self.systems[i].step(t, h, x[i], d,
-                                             tuple(map(self.functions[i-1],
-                                                       (t, t + h),
-                                                       (x[i-1], xnew[-1])))))
-
+        t1 = t + h
+        if (self._last is None or self._last[0] != t or
+                len(x) != len(self._last[1]) or
+                any(xi is not xl for xi, xl in zip(x, self._last[1]))):
+            outputs = [f(t, xprev) for f, xprev in zip(self.functions, x)]
+        else:
+            outputs = self._last[2]
+
+        steps = self._steps
+        xnew = [steps[0](t, h, x[0], d, inputs)]
+        outputs1 = []
+        for step, f, xi, y in zip(steps[1:], self.functions, x[1:], outputs):
+            outputs1.append(f(t1, xnew[-1]))
+            xnew.append(step(t, h, xi, d, (y, outputs1[-1])))
+
+        self._last = t1, tuple(xnew), outputs1
         return xnew
 
     def equilibrium(self,
                     x: Optional[Sequence[Any]]=None,
                     d: Optional[Any]=None,
+                    warm_start: bool=False,
                     **kwargs) -> List[Any]:
         """return an eventual steady-state solution
 
@@ -83,18 +133,36 @@ class SignalFlowPathSys(DySys):
         :param d: discrete dynamical variables, as stored in an object
         or dict; optional
 
+        :param warm_start: bool, if x is not given, take the previously
+        returned equilibrium as the initial guess instead of self.zero,
+        e.g. for iterative subsystems in a sweep of d [default False]
+
         Additional keyword arguments are passed on to the equilibrium
         methods of the subsystems.
 
         """
 
-        x = x if x is not None else self.zero
+        if x is None:
+            x = (self._equilibrium if warm_start and
+                 getattr(self, '_equilibrium', None) is not None
+                 else self.zero)
 
-        xoo = [self.systems[0].equilibrium(x[0], d, **kwargs)]
-        for i in range(1, len(self)):
-            xoo.append(self.systems[i].equilibrium(
-                x[i], d, map(self.functions[i-1],
-                             (0, np.inf), (x[i-1], xoo[-1])),
-                **kwargs))
+        equilibria = self._equilibria
+        xoo = [equilibria[0](x[0], d, **kwargs)]
+        for equilibrium, f, xi, xprev in zip(equilibria[1:], self.functions,
+                                             x[1:], x[:-1]):
+            xoo.append(equilibrium(
+                xi, d, (f(0, xprev), f(np.inf, xoo[-1])), **kwargs))
 
+        self._equilibrium = xoo
         return xoo
+
+
+def _copy(x: Any) -> Any:
+    """copy the arrays of a state, possibly nested in tuples or lists"""
+
+    if isinstance(x, np.ndarray):
+        return x.copy()
+    if isinstance(x, (tuple, list)):
+        return type(x)(map(_copy, x))
+    return x
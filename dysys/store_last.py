@@ -19,8 +19,10 @@ class StoreLast:
         self.source = source
 
     def __next__(self):
-        self.last = next(self.source)
-        return self.last
+        # The item is returned from a local rather than read back
+        # from self.last.
+        self.last = last = next(self.source)
+        return last
 
     next = __next__             # backward-compatibility with python2
 
@@ -10,17 +10,51 @@ taking synchronized approximate discrete steps in continuous time
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Sequence
+from weakref import finalize
 
 from dysys import DySys
 
 
 class UncoupledDySys(DySys):
 
-    def __init__(self, systems: Sequence[DySys]):
-        """initialize with a list of DySys"""
+    def __init__(self, systems: Sequence[DySys], n_workers: int=1):
+        """initialize with a list of DySys
+
+        :param n_workers: int, number of threads over which to
+        distribute the steps of the systems, which being uncoupled
+        can be taken concurrently; this only pays if the steps
+        release the GIL, as e.g. the sparse-LU solves of SparseDySys
+        do [default: 1, stepping the systems in turn]
+
+        """
 
         self.systems = systems
+        self.n_workers = n_workers
+        self._executor = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """return the thread pool, started on first use
+
+        and shut down by close or else when the system is collected
+
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.n_workers)
+            finalize(self, self._executor.shutdown, wait=False)
+        return self._executor
+
+    def close(self) -> None:
+        """shut down the thread pool, if any; step restarts it"""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self):
+        return dict(self.__dict__, _executor=None)  # threads don't pickle
 
     def step(self,
              t: float,
@@ -41,4 +75,8 @@ class UncoupledDySys(DySys):
 
         """
 
-        return [s._step(t, h, y, d) for s, y, d in zip(self.systems, yy, dd)]
+        if self.n_workers <= 1:
+            return [s._step(t, h, y, d)
+                    for s, y, d in zip(self.systems, yy, dd)]
+        return list(self._pool().map(lambda s, y, d: s._step(t, h, y, d),
+                                       self.systems, yy, dd))
@@ -1,7 +1,21 @@
 #!/usr/bin/env python
 
+from typing import Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix, spmatrix
 from toolz import compose
 
+try:
+    from scipy.sparse._sparsetools import csr_matvec as _sparsetools_matvec
+except ImportError:             # private to SciPy, so may move
+    _sparsetools_matvec = None
+
+try:
+    from numba import njit, prange
+except ImportError:             # numba is optional
+    njit = None
+
 
 def autonomous(*funcs):
     '''return a function which ignores its first argument
@@ -12,4 +26,85 @@ def autonomous(*funcs):
 
     '''
 
-    return compose(*funcs, lambda _, x, *args, **kwargs: x)
+    # The common cases of none or one function are specialized to a
+    # single Python frame per call, without toolz.compose, since
+    # these are called at every step, e.g. in SignalFlowPathSys.
+
+    if not funcs:
+        return lambda _, x, *args, **kwargs: x
+    func = funcs[0] if len(funcs) == 1 else compose(*funcs)
+    return lambda _, x, *args, **kwargs: func(x)
+
+
+def _csr_matvec_loop(data, indices, indptr, x, out):
+    """set out = A @ x, row by row, for numba"""
+
+    for i in prange(out.size):
+        s = 0.
+        for j in range(indptr[i], indptr[i + 1]):
+            s += data[j] * x[indices[j]]
+        out[i] = s
+
+
+def _csr_matvec_sparsetools(data, indices, indptr, x, out):
+    """set out = A @ x by the kernel behind scipy.sparse"""
+
+    if _sparsetools_matvec is None:
+        out[:] = csr_matrix((data, indices, indptr),
+                            (out.size, x.size)) @ x
+    else:
+        out.fill(0.)
+        _sparsetools_matvec(out.size, x.size, indptr, indices, data,
+                            np.asarray(x, out.dtype), out)
+
+
+csr_matvec = (_csr_matvec_sparsetools if njit is None
+              else njit(parallel=True, cache=True)(_csr_matvec_loop))
+csr_matvec.__doc__ = '''set out = A @ x for the CSR matrix A = (data, indices, indptr)
+
+in place and without the checking and dispatch of the scipy.sparse
+matrix-vector product; compiled by numba (in parallel over the rows)
+if available
+
+'''
+
+
+def matvec(A: spmatrix,
+           x: np.ndarray,
+           out: Optional[np.ndarray]=None) -> np.ndarray:
+    '''return A @ x, for a CSR matrix A, in out if given
+
+    This is for the inner loops of user-supplied functions, e.g. a
+    residual F of NonlinearSparseDySys of the form
+
+        def F(t, x, v, d=None):
+            return v + matvec(A, x, buffer) - b
+
+    with a fixed sparse A (converted to CSR once, beforehand) and
+    preallocated buffer.
+
+    '''
+
+    if out is None:
+        out = np.empty(A.shape[0], np.result_type(A.dtype, x.dtype))
+    csr_matvec(A.data, A.indices, A.indptr, x, out)
+    return out
+
+
+def on_pattern(P: csr_matrix, A: spmatrix) -> np.ndarray:
+    """return the entries of A laid out as the data of P
+
+    :param P: canonical CSR matrix, the sparsity of which includes
+    that of A
+
+    """
+
+    A = A.tocoo()
+    n = P.shape[1]
+    keys = np.repeat(np.arange(P.shape[0], dtype=np.int64),
+                     np.diff(P.indptr)) * n + P.indices
+    data = np.zeros(P.nnz, dtype=A.dtype)
+    np.add.at(data,
+              np.searchsorted(keys, A.row.astype(np.int64) * n + A.col),
+              A.data)
+    return data
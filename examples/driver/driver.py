@@ -11,9 +11,9 @@ equation for DySys#32.
 
 """
 
-from itertools import dropwhile
+from collections import deque
 from os.path import extsep
-from typing import Any, List, Optional, Tuple
+from typing import Any, Deque, Optional, Tuple
 
 import attr
 from toolz import compose, last
@@ -32,12 +32,17 @@ class Driver(DySys):
     def step(self,
              t: float,
              h: float,
-             y: List[Tuple[float, float]],
-             d: Optional[Any]=None) -> List[Tuple[float, float]]:
+             y: Deque[Tuple[float, float]],
+             d: Optional[Any]=None) -> Deque[Tuple[float, float]]:
+        # The history is copied once, so that the state y passed in
+        # is left intact, and then the copy is advanced in place,
+        # popping the pairs that fall out of the delay from the front.
         t1 = t + h
-        y1 = list(dropwhile(lambda tx: tx[0] < t1 - self.r,
-                            y))
-        return y1 + [(t1, y1[-1][1] - h * y1[0][1])]
+        y = deque(y)
+        while y[0][0] < t1 - self.r:
+            y.popleft()
+        y.append((t1, y[-1][1] - h * y[0][1]))
+        return y
 
 
 def main(name: str,
@@ -45,7 +50,7 @@ def main(name: str,
 
     r = np.pi / 2
     t = np.linspace(-r, 0)
-    y = list(zip(t, np.sin(t)))
+    y = deque(zip(t, np.sin(t)))
     print(y)
     driver = Driver(r)
 
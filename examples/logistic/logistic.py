@@ -12,7 +12,7 @@ from itertools import count
 from os.path import extsep
 
 import attr
-from toolz import sliding_window, take, unique
+from toolz import take, unique
 
 from matplotlib.pyplot import subplots
 import numpy as np
@@ -43,7 +43,7 @@ def main(name: str, mu: float=2.) -> None:
 
     x = list(take(7, sequence))
     print(x)
-    xy = np.array(list(sliding_window(2, np.repeat(x, 2)[1:])))
+    xy = np.lib.stride_tricks.sliding_window_view(np.repeat(x, 2)[1:], 2)
 
     fig, ax = subplots()
     fig.suptitle(f'Evolution of the logistic map for µ = {mu}.'
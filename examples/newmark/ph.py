@@ -1,8 +1,9 @@
+from functools import lru_cache
 from unicodedata import lookup
 
 import matplotlib.pyplot as plt
 import numpy as np
-from pandas import DataFrame, Panel
+from pandas import DataFrame
 from scipy.sparse import coo_matrix, csc_matrix, bmat, eye
 
 from dysys import SparseDySys, HilberHughesTaylor
@@ -20,25 +21,21 @@ def with_method(m, h, ic):
     ).T
 
 
-def exact(L, R, C, Q, t):
+@lru_cache()
+def poles(L, R, C):
+    """return the natural frequencies of the branch and their difference"""
     sigma = np.roots([L * C, R * C, 1])
-    Delta_sigma = np.diff(sigma)[0]
+    return sigma, np.diff(sigma)[0]
+
+
+def exact(L, R, C, Q, t):
+    sigma, Delta_sigma = poles(L, R, C)
+    growth = np.exp(np.multiply.outer(sigma, t)) - 1  # each exponential once
     return (
         np.real_if_close(
-            (
-                (np.exp(sigma[0] * t) - 1) * sigma[1]
-                - (np.exp(sigma[1] * t) - 1) * sigma[0]
-            )
-            * Q
-            / Delta_sigma
-        ),
-        np.real_if_close(
-            ((np.exp(sigma[0] * t) - 1) - (np.exp(sigma[1] * t) - 1))
-            / (sigma[1] - sigma[0])
-            * Q
-            / L
-            / C
+            (growth[0] * sigma[1] - growth[1] * sigma[0]) * Q / Delta_sigma
         ),
+        np.real_if_close((growth[0] - growth[1]) / Delta_sigma * Q / L / C),
     )
 
 
@@ -98,16 +95,22 @@ def main(name: str) -> None:
         }
     ).T
 
-    data = Panel(trajectories)
+    # Stack the trajectories as (method, time, variable) on the union
+    # of their times.
+
+    labels = list(trajectories)
+    times = np.array(sorted(set().union(*(df.index for df in trajectories.values()))))
+    data = np.stack([trajectories[k].reindex(times)[["x", "v"]].values for k in labels])
 
     fig, ax = plt.subplots(2)
-    t = np.linspace(0, max(data.major_axis), 999)
-    for order, variable in [(0, "x"), (1, "v")]:
-        for label, series in data.minor_xs(variable).iteritems():
-            ax[order].plot(series, marker="o", linestyle="None", label=label)
-        ax[order].plot(
-            t, exact(inertance, resistance, compliance, duty, t)[order], label="exact"
-        )
+    t = np.linspace(0, times[-1], 999)
+    responses = exact(inertance, resistance, compliance, duty, t)
+    for order in [0, 1]:
+        for i, label in enumerate(labels):
+            ax[order].plot(
+                times, data[i, :, order], marker="o", linestyle="None", label=label
+            )
+        ax[order].plot(t, responses[order], label="exact")
 
     fig.suptitle("step-duty for lumped RLC")
     ax[0].legend(loc=4)
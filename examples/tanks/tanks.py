@@ -40,13 +40,13 @@ def main(name: str) -> None:
     print('SignalFlowPathSysEquilibrium:', sfpeqm)
     eqm = np.array([0.25, 0.2])
     np.testing.assert_allclose(sfpeqm, eqm)
-    ptrajectory = DataFrame({t: x for t, x, _ in
-                             sfpsys.march_till(endtime, dt, ic)}).T
+    t, states = sfpsys.march_array(dt, endtime // dt - 1, ic)
+    ptrajectory = DataFrame(states, index=t)
 
-    exact = DataFrame({t: np.array([eqm[0] * (1 - np.exp(-t/25)),
-                                    (1 - np.exp(-t/25)) -
-                                    4/5 * (1 - np.exp(-t/20))])
-                       for t in ptrajectory.index}).T
+    exact = DataFrame(np.column_stack([eqm[0] * (1 - np.exp(-t/25)),
+                                       (1 - np.exp(-t/25)) -
+                                       4/5 * (1 - np.exp(-t/20))]),
+                      index=t)
     np.testing.assert_allclose(ptrajectory, exact, atol=1e-2)
 
     fig, ax = plt.subplots(2, sharex=True)
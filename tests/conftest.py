@@ -0,0 +1,24 @@
+import numpy as np
+from scipy.sparse import diags
+
+from pytest import fixture
+
+
+@fixture
+def line():
+    """return a factory of the CSR identity mass and Laplacian of a line
+
+    of n equal cells each exchanging with its neighbours, i.e. the
+    tridiagonal matrix with 2 on the diagonal and -1 either side
+
+    """
+
+    def line(n):
+        return (
+            diags(np.ones(n)).tocsr(),
+            diags(
+                [-np.ones(n - 1), 2 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1]
+            ).tocsr(),
+        )
+
+    return line
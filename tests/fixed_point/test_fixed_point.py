@@ -1,7 +1,17 @@
 import numpy as np
-from scipy.sparse import spdiags
+from scipy.sparse import csc_matrix
 
 from dysys import newton
+from dysys.fixed_point import reordering_solver
+
+from pytest import mark
+
+
+def diagonal(d):
+    """return the diagonal matrix with diagonal d, in CSC format"""
+
+    index = np.arange(len(d) + 1, dtype=np.int32)
+    return csc_matrix((d, index[:-1], index), shape=(len(d),) * 2, copy=False)
 
 
 class TestNewton:
@@ -15,18 +25,54 @@ class TestNewton:
 
         J(y) = 2 * y
 
+        which is diagonal, so given as such.
+
         """
 
         def res(y):
             return y[0] ** 2 - x[0]
 
         def jac(y):
-            return spdiags(2 * y[0], 0, *(len(x[0]),) * 2).tocsc()
+            return 2 * y[0]
 
         np.testing.assert_array_almost_equal(
             newton(res, jac, x, tol=10 ** -(decimals / 2)) ** 2, x, decimals
         )
 
+    @mark.parametrize("linsolve", [None, reordering_solver()])
+    def test_sqrt_sparse(self, linsolve, x=np.array([1.0, 2.0, 3.0])):
+        """as test_sqrt, with the diagonal Jacobian as a sparse matrix
+
+        and solving by default or reusing the ordering from iteration
+        to iteration
+
+        """
+
+        np.testing.assert_array_almost_equal(
+            newton(
+                lambda y: y**2 - x,
+                lambda y: diagonal(2 * y),
+                x,
+                tol=1e-9,
+                linsolve=linsolve,
+            ),
+            np.sqrt(x),
+        )
+
+    def test_sqrt_factor_reuse(self, x=np.array([1.0, 2.0, 3.0])):
+        """as test_sqrt, by modified Newton-iteration"""
+
+        np.testing.assert_array_almost_equal(
+            newton(
+                lambda y: y**2 - x,
+                lambda y: diagonal(2 * y),
+                x,
+                tol=1e-9,
+                factor_reuse=True,
+            ),
+            np.sqrt(x),
+        )
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.sparse import coo_matrix, diags
+from scipy.sparse import csc_matrix
 
 from dysys import SparseDySys
 
@@ -44,9 +44,20 @@ def test():
     nodes = connectivity.max() + 1
     branches = connectivity.shape[1]
 
-    G = -coo_matrix((np.ones(branches), connectivity), [nodes] * 2)
-    G = G + G.T
-    G = G - diags(np.array(G.sum(0)), [0])
+    # Assemble the graph Laplacian in one pass from the branches in
+    # both directions and the degrees of the nodes on the diagonal.
+
+    rows, columns = np.hstack([connectivity, connectivity[::-1]])
+    diagonal = np.arange(nodes)
+    G = csc_matrix(
+        (
+            np.concatenate(
+                [-np.ones(2 * branches), np.bincount(rows, minlength=nodes)]
+            ),
+            (np.concatenate([rows, diagonal]), np.concatenate([columns, diagonal])),
+        ),
+        [nodes] * 2,
+    )
     sys = SparseDySys(None, G)
 
     sys = sys.constrain([0, -1], [0.0, -5.0])
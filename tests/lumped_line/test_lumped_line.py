@@ -1,6 +1,5 @@
 import numpy as np
-from numpy.lib.ufunclike import fix
-from scipy.sparse import bmat, diags
+from scipy.sparse import csc_matrix
 
 from dysys import SparseDySys
 
@@ -34,13 +33,39 @@ class LumpedLine:
         self.L = 0.073557  # Pa.s^2/uL
         self.Q = -267.48  # uL/s
 
-        M = diags([[0, self.C, self.L]], [0])
-        B = bmat([[+1], [-1]])
-        D = bmat([[None, B], [-B.T, np.array([self.R])]])
-        self.sys = SparseDySys(M, D, lambda *_: [0, self.Q, 0])
+        # The descriptor matrices are written directly in CSC: M is
+        # diag(0, C, L) and D is [[0, B], [-B.T, R]] with B = [+1, -1].T.
 
+        M = csc_matrix(
+            (np.array([self.C, self.L]), np.array([1, 2]), np.array([0, 0, 1, 2])),
+            (3, 3),
+        )
+        D = csc_matrix(
+            (
+                np.array([-1.0, +1.0, +1.0, -1.0, self.R]),
+                np.array([2, 2, 0, 1, 2]),
+                np.array([0, 1, 2, 5]),
+            ),
+            (3, 3),
+        )
+        forcing = np.array([0.0, self.Q, 0.0])  # constant, so built once
+        self.sys = SparseDySys(M, D, lambda *_: forcing)
+        self._constrained = {}
 
-@fixture
+    def constrained(self, pin):
+        """return self.sys with the inlet pressure fixed at pin
+
+        constrained once for each pin, the factors computed by the
+        returned system then being kept with it for later tests
+
+        """
+
+        if pin not in self._constrained:
+            self._constrained[pin] = self.sys.constrain([0], [pin])
+        return self._constrained[pin]
+
+
+@fixture(scope="module")
 def lumped_line():
     return LumpedLine()
 
@@ -52,7 +77,7 @@ def test_equilibrium(lumped_line):
 
     """
 
-    sys = lumped_line.sys.constrain([0], [lumped_line.pin])
+    sys = lumped_line.constrained(lumped_line.pin)
     soln = sys.reconstitute(sys.equilibrium())
     p, q = soln[:2], soln[2]
     np.testing.assert_array_almost_equal(
@@ -62,16 +87,16 @@ def test_equilibrium(lumped_line):
 
 
 def test_harmonic(lumped_line):
-    f = np.array([14.0])
-    omega = 2 * np.pi * f
-    sys = lumped_line.sys.constrain([0], [0.0])
-    soln = sys.reconstitute(sys.harmonic(omega)[0])
-    p, q = soln[:2], soln[2]
+    """a sweep of frequencies, solved together"""
 
-    Z = lumped_line.R + 1j * omega * lumped_line.L
-    Y = 1j * omega * lumped_line.C + 1 / Z
+    f = np.array([3.0, 14.0, 50.0])
+    sys = lumped_line.constrained(0.0)
+    for omega, soln in zip(2 * np.pi * f, sys.harmonic(2 * np.pi * f)):
+        soln = sys.reconstitute(soln)
+        p, q = soln[:2], soln[2]
 
-    np.testing.assert_array_almost_equal(
-        p, np.concatenate(np.broadcast_arrays([0], lumped_line.Q / Y))
-    )
-    np.testing.assert_array_almost_equal(q, -lumped_line.Q / (Y * Z))
+        Z = lumped_line.R + 1j * omega * lumped_line.L
+        Y = 1j * omega * lumped_line.C + 1 / Z
+
+        np.testing.assert_array_almost_equal(p, [0, lumped_line.Q / Y])
+        np.testing.assert_array_almost_equal(q, -lumped_line.Q / (Y * Z))
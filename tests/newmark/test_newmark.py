@@ -0,0 +1,159 @@
+import numpy as np
+from scipy.sparse import diags
+
+from dysys import DySys, Newmark
+from dysys.newmark import central_difference, trapezoidal
+
+from pytest import fixture, raises
+
+
+class Chain:
+    """Consider a chain of n equal masses joined by equal springs
+
+    with a little damping on each mass, released from rest after a
+    linear initial displacement.
+
+    """
+
+    def __init__(self, line, n=5):
+        self.M, self.K = line(n)
+        self.C = 0.1 * self.M
+        self.ic = (np.linspace(0, 1, n), np.zeros(n))
+
+
+@fixture
+def chain(line):
+    return Chain(line)
+
+
+def history(sys, ic, endtime=3.0, h=0.1):
+    return np.array([x[0] for _, x, _ in sys.march_till(endtime, h, ic)])
+
+
+def test_central_difference_lumped(chain):
+    """with diagonal mass and damping, central difference is explicit
+
+    but agrees with the general Newmark method with beta = 0.
+
+    """
+
+    sys = central_difference(chain.M, chain.K, chain.C)
+    assert sys.lumped
+    np.testing.assert_array_almost_equal(
+        history(sys, chain.ic),
+        history(Newmark(chain.M, chain.K, chain.C, beta=0.0), chain.ic),
+    )
+
+
+def test_complex(chain):
+    """a complex state marches as its real and imaginary parts"""
+
+    def sys():
+        return central_difference(chain.M, chain.K, chain.C)
+
+    ic = tuple(x + 1j * x[::-1] for x in chain.ic)
+    x = history(sys(), ic)
+    np.testing.assert_array_almost_equal(
+        x,
+        history(sys(), tuple(x.real for x in ic))
+        + 1j * history(sys(), tuple(x.imag for x in ic)),
+    )
+    _, XV = sys().march_array(0.1, len(x) - 1, ic)
+    np.testing.assert_array_almost_equal(XV[:, 0], x)
+
+
+def test_massless():
+    """a massless degree of freedom is reported, not divided by"""
+
+    sys = Newmark(diags([1.0, 0.0]).tocsr(), diags([1.0, 1.0]).tocsr())
+    with raises(RuntimeError):
+        sys.solve_mass(np.ones(2))
+
+
+def test_trapezoidal_oscillator():
+    """an undamped unit oscillator x'' + x = 0 is x = cos t"""
+
+    sys = trapezoidal(*[diags([1.0]).tocsr()] * 2)
+    t, x = zip(
+        *(
+            (t, x[0][0])
+            for t, x, _ in sys.march_till(1.0, 1e-3, (np.ones(1), np.zeros(1)))
+        )
+    )
+    np.testing.assert_array_almost_equal(x, np.cos(t), 5)
+
+
+def test_march_array(chain):
+    t, XV = trapezoidal(chain.M, chain.K, chain.C).march_array(0.1, 30, chain.ic)
+    np.testing.assert_array_almost_equal(t, 0.1 * np.arange(31))
+    assert XV.shape == (31, 2, len(chain.ic[0]))
+    np.testing.assert_array_almost_equal(
+        XV[:-1, 0], history(trapezoidal(chain.M, chain.K, chain.C), chain.ic)
+    )
+    np.testing.assert_array_almost_equal(XV[0, 1], chain.ic[1])
+
+
+def test_eigs_lobpcg(line):
+    chain = Chain(line, 20)
+    sys = Newmark(chain.M, chain.K, definite=True)
+    np.testing.assert_array_almost_equal(
+        sys.eigs(k=3, lobpcg=True, maxiter=500),
+        np.sort(sys.eigs(k=3, return_eigenvectors=False)),
+    )
+
+
+def test_central_difference_march_array(chain):
+    """the compiled explicit march agrees with the general one"""
+
+    sys = central_difference(chain.M, chain.K, chain.C)
+    for actual, expected in zip(
+        sys.march_array(0.1, 30, chain.ic),
+        DySys.march_array(
+            central_difference(chain.M, chain.K, chain.C), 0.1, 30, chain.ic
+        ),
+    ):
+        np.testing.assert_array_almost_equal(actual, expected)
+
+
+def test_constant_forcing(chain):
+    """a constant forcing may be given as an array instead of a function"""
+
+    load = np.linspace(1.0, 2.0, len(chain.ic[0]))
+    np.testing.assert_array_almost_equal(
+        history(Newmark(chain.M, chain.K, chain.C, load), chain.ic),
+        history(Newmark(chain.M, chain.K, chain.C, lambda *_: load), chain.ic),
+    )
+    ic = tuple(x[1:] for x in chain.ic)
+    np.testing.assert_array_almost_equal(
+        history(Newmark(chain.M, chain.K, chain.C, load).constrain([0]), ic),
+        history(Newmark(chain.M, chain.K, chain.C, lambda *_: load).constrain([0]), ic),
+    )
+
+
+def test_equilibria(chain):
+    """batched equilibria agree with one equilibrium at a time"""
+
+    sys = Newmark(
+        chain.M,
+        chain.K,
+        chain.C,
+        lambda _, t, x, d: np.full(len(chain.ic[0]), d["load"]),
+    )
+    ds = [{"load": load} for load in [1.0, 2.0, 3.0]]
+    for (x, v), d in zip(sys.equilibria(None, ds), ds):
+        np.testing.assert_array_almost_equal(x, sys.equilibrium(None, d)[0])
+        np.testing.assert_array_equal(v, 0.0)
+
+
+def test_reassignment(chain):
+    """what is kept from the matrices is discarded when they change"""
+
+    sys = Newmark(chain.M, chain.K, chain.C, np.ones(len(chain.ic[0])))
+    np.testing.assert_array_almost_equal(sys.equilibrium()[0], [2.5, 4, 4.5, 4, 2.5])
+    history(sys, chain.ic)
+    sys.K = 2 * chain.K
+    np.testing.assert_array_almost_equal(sys.equilibrium()[0], [1.25, 2, 2.25, 2, 1.25])
+    np.testing.assert_array_almost_equal(
+        history(sys, chain.ic),
+        history(Newmark(chain.M, 2 * chain.K, chain.C, np.ones(5)), chain.ic),
+    )
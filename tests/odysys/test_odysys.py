@@ -0,0 +1,44 @@
+import warnings
+
+import numpy as np
+from scipy.sparse import diags
+
+from dysys import IVPDySys
+
+
+def test_ivp_decay():
+    """x' = -k x with a diagonal sparse Jacobian is x = exp(-k t)"""
+
+    k = np.arange(1.0, 4.0)
+    sys = IVPDySys(lambda t, x: -k * x, jac_sparsity=diags(k), rtol=1e-9, atol=1e-12)
+    for t, x, _ in sys.march_till(1.0, 0.1, np.ones(3)):
+        np.testing.assert_array_almost_equal(x, np.exp(-k * t))
+
+
+def test_ivp_explicit():
+    """an explicit solver is not given the Jacobian"""
+
+    k = np.arange(1.0, 4.0)
+    sys = IVPDySys(
+        lambda t, x: -k * x,
+        lambda t, x: diags(-k),
+        method="RK45",
+        rtol=1e-9,
+        atol=1e-12,
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        t, x, _ = list(sys.march_till(1.0, 0.1, np.ones(3)))[-1]
+    np.testing.assert_array_almost_equal(x, np.exp(-k * t))
+
+
+def test_ivp_event():
+    """the solver is restarted after an event changes the state"""
+
+    sys = IVPDySys(lambda t, x: -x, rtol=1e-9, atol=1e-12)
+    t, x, _ = list(
+        sys.march_till(
+            1.0, 0.1, np.ones(1), {}, events=[(0.5, lambda _, t, x, d: (2 * x, d))]
+        )
+    )[-1]
+    np.testing.assert_array_almost_equal(x, 2 * np.exp(-t))
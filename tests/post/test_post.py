@@ -0,0 +1,35 @@
+import numpy as np
+
+from dysys.post import segment, segment_array
+
+
+def test_segment():
+    history = [(t / 4, t) for t in range(10)]
+    assert list(segment(history, 1.0)) == [
+        ((0.0, 0), (0.25, 1), (0.5, 2), (0.75, 3)),
+        ((1.0, 4), (1.25, 5), (1.5, 6), (1.75, 7)),
+        ((2.0, 8), (2.25, 9)),
+    ]
+
+
+def test_segment_array():
+    history = np.array([(t / 4, t) for t in range(10)])
+    np.testing.assert_array_equal(segment_array(history[:, 0], 1.0), [0, 4, 8, 10])
+    for actual, expected in zip(segment(history, 1.0), segment(history.tolist(), 1.0)):
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_segment_array_dtypes():
+    """times of any floating type are segmented alike"""
+
+    for dtype in [np.float16, np.float32, np.float64, np.longdouble]:
+        np.testing.assert_array_equal(
+            segment_array(np.arange(0, 3, 0.5, dtype=dtype), 1.0), [0, 2, 4, 6]
+        )
+
+
+def test_segment_empty():
+    """an empty history has no periods, as an array or not"""
+
+    assert list(segment(np.empty((0, 2)), 1.0)) == []
+    assert list(segment([], 1.0)) == []
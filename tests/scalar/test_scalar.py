@@ -1,7 +1,6 @@
 from functools import lru_cache
 
 import numpy as np
-from pandas import Series
 
 from dysys import ScalarLinearDySys
 
@@ -38,7 +37,11 @@ class Scalar:
     
     @property
     def system(self):
-        return ScalarLinearDySys(self.R * self.C, 1.0, lambda *_: self.p_in, theta=0.5)
+        if not hasattr(self, "_system"):
+            self._system = ScalarLinearDySys(
+                self.R * self.C, 1.0, lambda *_: self.p_in, theta=0.5
+            )
+        return self._system
 
 
 @fixture
@@ -71,13 +74,7 @@ def test_march(scalar):
 
     """
 
-    p = Series(
-        {
-            t / scalar.R / scalar.C: x
-            for t, x, _ in scalar.sys.march_till(
-                5 * scalar.R * scalar.C, scalar.R * scalar.C / 1e3
-            )
-        }
-    )
+    RC = scalar.R * scalar.C
+    t, p = scalar.sys.march_array(RC / 1e3, 5000)
 
-    np.testing.assert_array_almost_equal(p, scalar.p_in * (1 - np.exp(-p.index)))
+    np.testing.assert_array_almost_equal(p, scalar.p_in * (1 - np.exp(-t / RC)))
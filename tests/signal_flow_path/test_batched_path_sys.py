@@ -0,0 +1,32 @@
+import numpy as np
+
+from dysys import BatchedPathSys, ScalarLinearDySys, SignalFlowPathSys, SparseDySys
+
+
+def path(line, forcing, n=4):
+    """a scalar lag feeding a damped line, forced by the lag"""
+
+    return [
+        ScalarLinearDySys(1, 0.04, lambda *_: 0.01, 0.5),
+        SparseDySys(*line(n), forcing, 0.5),
+    ]
+
+
+def test_batched_path_sys(line):
+    """a batch agrees with its paths marched one at a time"""
+
+    n = 4
+    ics = [(a, np.linspace(0, a, n)) for a in [0.0, 1.0, 2.0]]
+    batch = BatchedPathSys(
+        path(line, lambda sys, t, x, d, y: np.outer(np.ones(n), y)), batch=len(ics)
+    )
+    assert [z.shape for z in batch.zero] == [(3,), (n, 3)]
+    assert batch._steps == [s.step for s in batch.systems]
+    *_, (_, xs, _) = batch.march_till(2.0, 0.1, [np.stack(x, -1) for x in zip(*ics)])
+    for j, ic in enumerate(ics):
+        sys = SignalFlowPathSys(path(line, lambda sys, t, x, d, y: np.ones(n) * y))
+        *_, (_, x, _) = sys.march_till(2.0, 0.1, list(ic))
+        for actual, expected in zip(xs, x):
+            np.testing.assert_array_almost_equal(actual[..., j], expected)
+    for actual, expected in zip(batch.equilibrium(), sys.equilibrium()):
+        np.testing.assert_array_almost_equal(actual[..., 0], expected)
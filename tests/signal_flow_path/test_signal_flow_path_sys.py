@@ -1,8 +1,9 @@
 import numpy as np
-from pandas import DataFrame
 
 from dysys import SignalFlowPathSys, ScalarLinearDySys
 
+from pytest import raises
+
 
 class TestSignalFlowPathSys:
     sys = SignalFlowPathSys(
@@ -18,10 +19,7 @@ class TestSignalFlowPathSys:
         np.testing.assert_almost_equal(self.sys.equilibrium(), self.eqm)
 
     def test_march(self):
-        trajectory = DataFrame(
-            {t: x for t, x, _ in self.sys.march_till(100, 1, self.sys.zero)}
-        ).T
-        t = trajectory.index
+        t, trajectory = self.sys.march_array(1, 99, self.sys.zero)
         exact = np.array(
             [
                 self.eqm[0] * (1 - np.exp(-t / 25)),
@@ -29,3 +27,48 @@ class TestSignalFlowPathSys:
             ]
         ).T
         np.testing.assert_allclose(trajectory, exact, atol=1e-3)
+
+    def test_march_reuses_outputs(self):
+        """the mapping is evaluated once per step when marching"""
+
+        calls = []
+
+        def f(t, x):
+            calls.append(t)
+            return x
+
+        sys = SignalFlowPathSys(self.sys.systems, [f])
+        trajectory = [x for _, x, _ in sys.march_till(100, 1, sys.zero)]
+        assert len(calls) == len(trajectory) + 1
+        np.testing.assert_array_equal(
+            trajectory,
+            [x for _, x, _ in self.sys.march_till(100, 1, self.sys.zero)])
+
+    def test_step_replaced_state(self):
+        """a state replaced in the returned list is not stale"""
+
+        sys = SignalFlowPathSys(self.sys.systems)
+        x = sys.step(0.0, 1.0, sys.zero, None)
+        x[0] = 1.0
+        np.testing.assert_array_equal(
+            sys.step(1.0, 1.0, x, None),
+            SignalFlowPathSys(self.sys.systems).step(1.0, 1.0, x, None),
+        )
+
+    def test_systems_immutable(self):
+        """the subsystems cannot be changed behind the bound methods"""
+
+        with raises(TypeError):
+            self.sys.systems[0] = self.sys.systems[1]
+
+    def test_zero_reset(self):
+        """setting the subsystems again takes their zero states afresh"""
+
+        sys = SignalFlowPathSys(self.sys.systems)
+        sys.systems = sys.systems[:1]
+        assert len(sys.zero) == 1
+
+    def test_equilibrium_warm_start(self):
+        self.sys.equilibrium()
+        np.testing.assert_almost_equal(
+            self.sys.equilibrium(warm_start=True), self.eqm)
@@ -0,0 +1,234 @@
+import warnings
+
+import numpy as np
+from scipy.sparse import diags
+
+from dysys import SparseDySys, SparseNFDySys
+from dysys.linear_dysys import LinearDySys
+
+from pytest import fixture, importorskip
+
+
+@fixture
+def diffusion(line):
+    """return a factory of lines of n cells exchanging heat
+
+    the middle one heated
+
+    """
+
+    def diffusion(n=50, **kwargs):
+        return SparseDySys(
+            *line(n),
+            lambda sys, t, x, d: np.sin(t) * (np.arange(n) == n // 2),
+            0.5,
+            **kwargs
+        )
+
+    return diffusion
+
+
+def final(sys, endtime=1.0, h=0.1, ic=None):
+    ic = np.linspace(0, 1, len(sys)) if ic is None else ic
+    *_, (_, x, _) = sys.march_till(endtime, h, ic)
+    return x
+
+
+def stepped(sys, h=0.1, ic=None, steps=10, tol=1e-10):
+    """step sys directly, to pass a tolerance to its iterations"""
+
+    x = np.linspace(0, 1, len(sys)) if ic is None else ic
+    for t in h * np.arange(steps):
+        x = sys.step(t, h, x, None, tol)
+    return x
+
+
+def test_krylov(diffusion):
+    """preconditioned GMRES agrees with sparse-LU"""
+
+    np.testing.assert_array_almost_equal(
+        final(diffusion(solver="krylov")), final(diffusion())
+    )
+
+
+def test_nonlinear_forcing(diffusion):
+    """SparseNFDySys agrees with and without the Jacobian of f"""
+
+    sys = diffusion(5)
+    args = sys.M, sys.D, lambda t, x, d: 1 - x**3
+    np.testing.assert_array_almost_equal(
+        stepped(SparseNFDySys(*args, lambda t, x, d: diags(-3 * x**2))),
+        stepped(SparseNFDySys(*args)),
+        10,
+    )
+
+
+def test_nonlinear_forcing_stiff(diffusion):
+    """a stiff step stalling Newton-Krylov falls back to root"""
+
+    sys = diffusion(5)
+    args = sys.M, sys.D, lambda t, x, d: 1 - 1e3 * x**3
+    np.testing.assert_array_almost_equal(
+        stepped(
+            SparseNFDySys(*args, lambda t, x, d: diags(-3e3 * x**2)),
+            h=1.0,
+            ic=np.zeros(5),
+            steps=1,
+        ),
+        stepped(SparseNFDySys(*args), h=1.0, ic=np.zeros(5), steps=1),
+        10,
+    )
+
+
+def test_reorder(diffusion):
+    """stepping in the reverse Cuthill-McKee ordering changes nothing"""
+
+    sys = diffusion()
+    perm = np.random.default_rng(0).permutation(len(sys))
+    shuffled = SparseDySys(
+        sys.M[perm][:, perm],
+        sys.D[perm][:, perm],
+        lambda _, t, x, d: sys.f(sys, t, x, d)[perm],
+        sys.theta,
+        reorder=True,
+    )
+    np.testing.assert_array_almost_equal(
+        final(shuffled, ic=np.linspace(0, 1, len(sys))[perm]), final(sys)[perm]
+    )
+    ic = np.linspace(0, 1, len(sys))
+    known = np.flatnonzero(perm == 0)
+    constrained = shuffled.constrain(known)
+    assert constrained.reorder
+    np.testing.assert_array_almost_equal(
+        constrained.reconstitute(final(constrained, ic=np.delete(ic[perm], known))),
+        sys.constrain([0]).reconstitute(final(sys.constrain([0]), ic=ic[1:]))[perm],
+    )
+
+
+def test_compile(diffusion):
+    """the compiled substitutions agree with SuperLU"""
+
+    importorskip("numba")
+    sys = diffusion()
+    sys.compile()
+    np.testing.assert_array_almost_equal(final(sys), final(diffusion()))
+
+
+def test_batch(diffusion):
+    """a batch of initial conditions marches as each would alone"""
+
+    ics = np.outer(np.linspace(0, 1, 50), [0.0, 1.0, 2.0])
+    np.testing.assert_array_almost_equal(
+        final(diffusion(), ic=ics),
+        np.column_stack([final(diffusion(), ic=ic) for ic in ics.T]),
+    )
+
+
+def test_eigs_small(diffusion):
+    """a system too small for ARPACK falls back to its dense spectrum"""
+
+    sys = diffusion(3)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        modes = sys.eigs(k=2, return_eigenvectors=False)
+    np.testing.assert_array_almost_equal(
+        np.sort(modes.real), np.sort(sys.eig(right=False).real)
+    )
+
+
+def test_forcing_out(diffusion):
+    """a forcing writing into a buffer agrees with one returning arrays"""
+
+    sys = diffusion(5)
+    f1 = lambda t, x, d: diags(-3 * x**2)
+    np.testing.assert_array_almost_equal(
+        final(
+            SparseNFDySys(
+                sys.M,
+                sys.D,
+                lambda t, x, d, out: np.subtract(1, x**3, out=out),
+                f1,
+                f_out=True,
+            )
+        ),
+        final(SparseNFDySys(sys.M, sys.D, lambda t, x, d: 1 - x**3, f1)),
+    )
+
+
+def test_harmonic(diffusion):
+    """a sweep of frequencies agrees with one solution at a time"""
+
+    sys = diffusion(reorder=True)
+    sys.f = lambda *_: np.arange(len(sys)) == 0
+    omega = np.linspace(0.1, 2.0, 5)
+    for actual, expected in zip(sys.harmonic(omega), LinearDySys.harmonic(sys, omega)):
+        np.testing.assert_array_almost_equal(actual, expected)
+
+
+def test_harmonic_single(diffusion):
+    """a sweep in single precision agrees with one in double"""
+
+    systems = [diffusion(), diffusion(dtype=np.float32)]
+    for sys in systems:
+        sys.f = lambda *_: np.arange(len(sys)) == 0
+    np.testing.assert_array_almost_equal(
+        *[sys.harmonic([0.5, 1.0]) for sys in systems], 5
+    )
+
+
+def test_krylov_batch(diffusion):
+    """preconditioned GMRES marches a batch column by column"""
+
+    ics = np.outer(np.linspace(0, 1, 50), [0.0, 1.0, 2.0])
+    np.testing.assert_array_almost_equal(
+        final(diffusion(solver="krylov"), ic=ics), final(diffusion(), ic=ics)
+    )
+
+
+def test_single(diffusion):
+    """a march in single precision agrees with one in double"""
+
+    x = final(diffusion(dtype=np.float32))
+    assert x.dtype == np.float32
+    np.testing.assert_array_almost_equal(x, final(diffusion()), 5)
+
+
+def test_single_constrained(diffusion):
+    """a constrained system keeps its single precision"""
+
+    x = final(diffusion(dtype=np.float32).constrain([0]))
+    assert x.dtype == np.float32
+    np.testing.assert_array_almost_equal(x, final(diffusion().constrain([0])), 5)
+
+
+def test_promote(diffusion):
+    """a march after promote agrees with one in double throughout"""
+
+    sys = diffusion(dtype=np.float32)
+    sys.promote()
+    x = final(sys)
+    assert x.dtype == np.float64
+    np.testing.assert_array_almost_equal(x, final(diffusion()), 12)
+
+
+def test_symmetric(diffusion):
+    """the minimum-degree ordering for symmetric pencils changes nothing"""
+
+    sys = diffusion(symmetric=True)
+    assert sys.symmetric
+    np.testing.assert_array_almost_equal(final(sys), final(diffusion()), 12)
+    sys = sys.constrain([0])
+    assert sys.symmetric
+    np.testing.assert_array_almost_equal(
+        final(sys), final(diffusion().constrain([0])), 12
+    )
+
+
+def test_constrain_options(diffusion):
+    """the options for solving survive constrain"""
+
+    sys = diffusion(solver="krylov", dtype=np.float32).constrain([0])
+    assert sys.solver == "krylov" and sys.D.dtype == np.float32
+    np.testing.assert_array_almost_equal(
+        final(sys), final(diffusion().constrain([0])), 5
+    )
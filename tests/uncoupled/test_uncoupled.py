@@ -0,0 +1,30 @@
+import pickle
+
+import numpy as np
+from scipy.sparse import diags
+
+from dysys import SparseDySys, UncoupledDySys
+
+
+def test_workers(line):
+    """stepping the systems concurrently changes nothing"""
+
+    systems = [SparseDySys(*line(n)) for n in [3, 5, 7]]
+    yy = [np.linspace(0, 1, len(s)) for s in systems]
+    dd = [None] * len(systems)
+    for actual, expected in zip(
+        UncoupledDySys(systems, 2).step(0.0, 0.1, yy, dd),
+        UncoupledDySys(systems).step(0.0, 0.1, yy, dd),
+    ):
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_close():
+    """the pool is shut down by close and left out of pickles"""
+
+    sys = UncoupledDySys([SparseDySys(diags(np.ones(2)), diags(np.ones(2)))], 2)
+    sys.step(0.0, 0.1, [np.ones(2)], [None])
+    executor = sys._executor
+    assert pickle.loads(pickle.dumps(sys))._executor is None
+    sys.close()
+    assert sys._executor is None and executor._shutdown
@@ -0,0 +1,18 @@
+import numpy as np
+from scipy.sparse import random
+
+from dysys.util import autonomous, matvec
+
+
+def test_matvec():
+    A = random(7, 5, 0.3, format="csr", random_state=0)
+    x = np.arange(5.0)
+    out = np.empty(7)
+    assert matvec(A, x, out) is out
+    np.testing.assert_array_almost_equal(out, A @ x)
+
+
+def test_autonomous():
+    assert autonomous()(0.0, 3.0) == 3.0
+    assert autonomous(np.negative)(1.0, 3.0, None) == -3.0
+    assert autonomous(np.negative, np.square)(1.0, 3.0) == -9.0